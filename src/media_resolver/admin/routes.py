@@ -14,6 +14,14 @@ from media_resolver.request_logger import get_request_logger
 
 logger = structlog.get_logger()
 
+# Render JSON API responses with orjson when installed; ORJSONResponse
+# imports fine without it but fails at render time, so gate on the package.
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as _DefaultJSONResponse
+except ImportError:  # pragma: no cover - depends on environment
+    _DefaultJSONResponse = JSONResponse
+
 # Templates directory
 ADMIN_DIR = Path(__file__).parent
 TEMPLATES_DIR = ADMIN_DIR / "templates"
@@ -23,7 +31,7 @@ templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
 
 def create_admin_app() -> FastAPI:
     """Create the admin FastAPI application."""
-    app = FastAPI(title="Media Resolver Admin")
+    app = FastAPI(title="Media Resolver Admin", default_response_class=_DefaultJSONResponse)
 
     @app.get("/", response_class=HTMLResponse)
     async def admin_home(request: Request):
@@ -1,13 +1,21 @@
 """Configuration management for Media Resolver."""
 
+import copy
 import os
 from pathlib import Path
 from typing import Any
 
 import yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Prefer the libyaml C loader when PyYAML was built against it; the pure-Python
+# SafeLoader parses the same documents an order of magnitude slower.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader as _YamlLoader
+
 
 class LLMBackend(BaseModel):
     """Individual LLM backend configuration."""
@@ -38,11 +46,15 @@ class LLMConfig(BaseModel):
         description="Name of the currently active backend",
     )
 
+    # Name -> backend lookup built once after validation, so the active
+    # backend is resolved without scanning the list on every call
+    _backends_by_name: dict[str, LLMBackend] = PrivateAttr(default_factory=dict)
+
     def get_active_backend(self) -> LLMBackend | None:
         """Get the currently active backend configuration."""
-        for backend in self.backends:
-            if backend.name == self.active_backend:
-                return backend
+        backend = self._backends_by_name.get(self.active_backend)
+        if backend is not None:
+            return backend
         # Fallback to first backend if active not found
         return self.backends[0] if self.backends else None
 
@@ -81,6 +93,8 @@ class LLMConfig(BaseModel):
             self.backends = [legacy_backend]
             self.active_backend = "default"
 
+        self._backends_by_name = {backend.name: backend for backend in self.backends}
+
 
 class MopidyConfig(BaseModel):
     """Mopidy connection configuration."""
@@ -127,6 +141,9 @@ class ServerConfig(BaseModel):
     host: str = Field(default="0.0.0.0", description="Server host")
     port: int = Field(default=8000, ge=1, le=65535, description="Server port")
     log_level: str = Field(default="INFO", description="Logging level")
+    tracing_enabled: bool = Field(
+        default=False, description="Emit OpenTelemetry spans (requires the 'tracing' extra)"
+    )
 
 
 class Config(BaseModel):
@@ -151,6 +168,9 @@ class Config(BaseModel):
     max_request_history: int = Field(
         default=500, ge=10, description="Maximum number of requests to keep in history"
     )
+    request_logging_enabled: bool = Field(
+        default=True, description="Whether to record tool calls in the request history"
+    )
 
 
 class Settings(BaseSettings):
@@ -164,6 +184,7 @@ class Settings(BaseSettings):
     host: str | None = None
     port: int | None = None
     log_level: str | None = None
+    tracing_enabled: bool | None = None
 
     # Mopidy
     mopidy_rpc_url: str | None = None
@@ -185,6 +206,36 @@ class Settings(BaseSettings):
 
     # History
     max_request_history: int | None = None
+    request_logging_enabled: bool | None = None
+
+
+# Parsed-YAML cache keyed by resolved path, versioned by file mtime. The raw
+# dict is cached (and copied before the env-override merge mutates it) so
+# environment overrides are still applied fresh on every load.
+_yaml_cache: dict[Path, tuple[int, dict[str, Any]]] = {}
+
+
+def _load_yaml(config_path: Path) -> dict[str, Any]:
+    """
+    Parse a YAML config file, reusing the cached parse while it is unchanged.
+
+    Args:
+        config_path: Path to the YAML file (must exist)
+
+    Returns:
+        Parsed config dict (a fresh copy, safe for the caller to mutate)
+    """
+    resolved = config_path.resolve()
+    mtime_ns = resolved.stat().st_mtime_ns
+
+    cached = _yaml_cache.get(resolved)
+    if cached is None or cached[0] != mtime_ns:
+        with open(resolved) as f:
+            parsed = yaml.load(f, Loader=_YamlLoader) or {}
+        _yaml_cache[resolved] = (mtime_ns, parsed)
+        cached = _yaml_cache[resolved]
+
+    return copy.deepcopy(cached[1])
 
 
 def load_config(config_path: Path | None = None) -> Config:
@@ -214,8 +265,7 @@ def load_config(config_path: Path | None = None) -> Config:
     # Load base config from YAML
     config_dict: dict[str, Any] = {}
     if config_path and config_path.exists():
-        with open(config_path) as f:
-            config_dict = yaml.safe_load(f) or {}
+        config_dict = _load_yaml(config_path)
 
     # Load environment settings
     env_settings = Settings()
@@ -227,6 +277,8 @@ def load_config(config_path: Path | None = None) -> Config:
         config_dict.setdefault("server", {})["port"] = env_settings.port
     if env_settings.log_level:
         config_dict.setdefault("server", {})["log_level"] = env_settings.log_level
+    if env_settings.tracing_enabled is not None:
+        config_dict.setdefault("server", {})["tracing_enabled"] = env_settings.tracing_enabled
 
     if env_settings.mopidy_rpc_url:
         config_dict.setdefault("mopidy", {})["rpc_url"] = env_settings.mopidy_rpc_url
@@ -257,6 +309,9 @@ def load_config(config_path: Path | None = None) -> Config:
     if env_settings.max_request_history:
         config_dict["max_request_history"] = env_settings.max_request_history
 
+    if env_settings.request_logging_enabled is not None:
+        config_dict["request_logging_enabled"] = env_settings.request_logging_enabled
+
     return Config(**config_dict)
 
 
@@ -1,8 +1,9 @@
 """LLM-powered disambiguation service for media candidates."""
 
 import json
+import re
 import time
-from typing import Any
+from typing import Any, Final
 
 import structlog
 from langchain_core.language_models import BaseChatModel
@@ -11,9 +12,59 @@ from langchain_core.messages import HumanMessage, SystemMessage
 from media_resolver.config import get_config
 from media_resolver.disambiguation.llm_provider import create_llm, get_model_info
 from media_resolver.models import LLMInteraction, MediaCandidate
+from media_resolver.tracing import get_tracer
+
+# Parse LLM responses with orjson when the optional 'speed' extra is installed.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so the parse-error
+# fallback below behaves identically either way.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - depends on optional extra
+    _json_loads = json.loads
 
 logger = structlog.get_logger()
 
+# Matches a response wrapped in a markdown code fence (``` or ```json),
+# capturing the JSON payload inside.
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*(.*?)\s*```\s*$", re.DOTALL)
+
+# Static prompt text, composed once at import so each call only formats the
+# query-specific parts.
+_SYSTEM_PROMPT: Final[
+    str
+] = """You are an expert music and podcast recommendation assistant. Your job is to analyze user queries and candidate media items, then rank the candidates by relevance to the user's intent.
+
+You should consider:
+1. Exact matches vs. partial matches
+2. Artist/show name matches
+3. Popularity and recency (when applicable)
+4. Contextual clues in the query
+5. Genre and style preferences
+
+Be decisive - if one candidate is clearly the best match, rank it first with high confidence. If multiple candidates are equally good, explain why and rank them accordingly."""
+
+_USER_PROMPT_TEMPLATE: Final[str] = """User query: "{query}"
+
+Candidates:
+{candidates_json}
+
+Please analyze these candidates and:
+1. Explain your reasoning about which candidate(s) best match the query
+2. Rank the candidates by relevance (best first)
+3. Indicate your confidence level
+
+Respond in this JSON format:
+{{
+  "reasoning": "Your detailed reasoning here",
+  "ranked_indices": [2, 0, 1, ...],
+  "confidence": "high|medium|low"
+}}
+
+The ranked_indices should be the indices from the candidates list, ordered from most to least relevant.
+Include up to {max_indices} ranked indices."""
+
 
 class DisambiguationService:
     """
@@ -31,6 +82,7 @@ class DisambiguationService:
             llm: Optional LangChain chat model. If None, creates from config.
         """
         self.log = logger.bind(component="disambiguation")
+        self._tracer = get_tracer(__name__)
 
         if llm is None:
             config = get_config()
@@ -53,6 +105,7 @@ class DisambiguationService:
         candidates: list[MediaCandidate],
         context: dict[str, Any] | None = None,
         top_k: int = 1,
+        force_rank: bool = False,
     ) -> tuple[list[MediaCandidate], LLMInteraction | None]:
         """
         Disambiguate and rank candidates using LLM.
@@ -62,6 +115,8 @@ class DisambiguationService:
             candidates: List of candidate media items
             context: Optional additional context (e.g., media type, user preferences)
             top_k: Number of top candidates to return
+            force_rank: Invoke the LLM even when top_k covers all candidates
+                (for callers that need the ordering, not just the set)
 
         Returns:
             Tuple of (ranked candidates, LLM interaction details)
@@ -69,10 +124,11 @@ class DisambiguationService:
         if not candidates:
             return [], None
 
-        if len(candidates) == 1:
-            # No disambiguation needed
-            self.log.debug("single_candidate_no_disambiguation")
-            return candidates, None
+        if len(candidates) == 1 or (top_k >= len(candidates) and not force_rank):
+            # Ranking cannot change which candidates are returned, so the LLM
+            # call would be wasted latency and tokens.
+            self.log.debug("skipping_disambiguation", num_candidates=len(candidates), top_k=top_k)
+            return candidates[:top_k], None
 
         self.log.info(
             "starting_disambiguation",
@@ -92,7 +148,10 @@ class DisambiguationService:
 
         try:
             # Call LLM
-            response = await self.llm.ainvoke(messages)
+            with self._tracer.start_as_current_span(
+                "llm.disambiguate", attributes={"candidates": len(candidates)}
+            ):
+                response = await self.llm.ainvoke(messages)
             latency_ms = int((time.time() - start_time) * 1000)
 
             # Parse response
@@ -134,64 +193,34 @@ class DisambiguationService:
 
     def _build_system_prompt(self, context: dict[str, Any] | None = None) -> str:
         """Build system prompt for disambiguation."""
-        base_prompt = """You are an expert music and podcast recommendation assistant. Your job is to analyze user queries and candidate media items, then rank the candidates by relevance to the user's intent.
+        if not context:
+            return _SYSTEM_PROMPT
 
-You should consider:
-1. Exact matches vs. partial matches
-2. Artist/show name matches
-3. Popularity and recency (when applicable)
-4. Contextual clues in the query
-5. Genre and style preferences
-
-Be decisive - if one candidate is clearly the best match, rank it first with high confidence. If multiple candidates are equally good, explain why and rank them accordingly."""
-
-        if context:
-            context_str = "\n\nAdditional context:\n"
-            for key, value in context.items():
-                context_str += f"- {key}: {value}\n"
-            base_prompt += context_str
-
-        return base_prompt
+        context_lines = "\n".join(f"- {key}: {value}" for key, value in context.items())
+        return f"{_SYSTEM_PROMPT}\n\nAdditional context:\n{context_lines}\n"
 
     def _build_user_prompt(self, query: str, candidates: list[MediaCandidate], top_k: int) -> str:
         """Build user prompt with query and candidates."""
         # Format candidates as JSON-like structure
-        candidates_data = []
-        for i, candidate in enumerate(candidates):
-            candidates_data.append(
-                {
-                    "index": i,
-                    "title": candidate.title,
-                    "subtitle": candidate.subtitle,
-                    "kind": candidate.kind.value,
-                    "snippet": candidate.snippet,
-                    "published": candidate.published,
-                }
-            )
+        candidates_data = [
+            {
+                "index": i,
+                "title": candidate.title,
+                "subtitle": candidate.subtitle,
+                "kind": candidate.kind.value,
+                "snippet": candidate.snippet,
+                "published": candidate.published,
+            }
+            for i, candidate in enumerate(candidates)
+        ]
 
         candidates_json = json.dumps(candidates_data, indent=2)
 
-        prompt = f"""User query: "{query}"
-
-Candidates:
-{candidates_json}
-
-Please analyze these candidates and:
-1. Explain your reasoning about which candidate(s) best match the query
-2. Rank the candidates by relevance (best first)
-3. Indicate your confidence level
-
-Respond in this JSON format:
-{{
-  "reasoning": "Your detailed reasoning here",
-  "ranked_indices": [2, 0, 1, ...],
-  "confidence": "high|medium|low"
-}}
-
-The ranked_indices should be the indices from the candidates list, ordered from most to least relevant.
-Include up to {min(top_k * 2, len(candidates))} ranked indices."""
-
-        return prompt
+        return _USER_PROMPT_TEMPLATE.format(
+            query=query,
+            candidates_json=candidates_json,
+            max_indices=min(top_k * 2, len(candidates)),
+        )
 
     def _parse_llm_response(
         self, response_text: str, candidates: list[MediaCandidate]
@@ -207,35 +236,30 @@ Include up to {min(top_k * 2, len(candidates))} ranked indices."""
             Tuple of (reasoning, ranked candidates)
         """
         try:
-            # Try to parse as JSON
-            # Handle markdown code blocks if present
-            response_text = response_text.strip()
-            if response_text.startswith("```json"):
-                response_text = response_text[7:]
-            if response_text.startswith("```"):
-                response_text = response_text[3:]
-            if response_text.endswith("```"):
-                response_text = response_text[:-3]
-            response_text = response_text.strip()
-
-            data = json.loads(response_text)
+            # Try to parse as JSON, unwrapping a markdown code fence if present
+            match = _FENCE_RE.match(response_text)
+            response_text = match.group(1) if match else response_text.strip()
+
+            data = _json_loads(response_text)
 
             reasoning = data.get("reasoning", "No reasoning provided")
             ranked_indices = data.get("ranked_indices", [])
 
-            # Reorder candidates
-            ranked_candidates = []
-            used_indices = set()
-
-            for idx in ranked_indices:
-                if 0 <= idx < len(candidates) and idx not in used_indices:
-                    ranked_candidates.append(candidates[idx])
-                    used_indices.add(idx)
+            # Reorder candidates, dropping out-of-range and duplicate indices
+            # (seen.add returns None, so the or-clause marks an index used
+            # without rejecting it)
+            n = len(candidates)
+            seen: set[int] = set()
+            ranked_candidates = [
+                candidates[idx]
+                for idx in ranked_indices
+                if 0 <= idx < n and not (idx in seen or seen.add(idx))
+            ]
 
             # Add any remaining candidates
-            for idx, candidate in enumerate(candidates):
-                if idx not in used_indices:
-                    ranked_candidates.append(candidate)
+            ranked_candidates += [
+                candidate for idx, candidate in enumerate(candidates) if idx not in seen
+            ]
 
             return reasoning, ranked_candidates
 
@@ -261,8 +285,11 @@ Include up to {min(top_k * 2, len(candidates))} ranked indices."""
         if len(candidates) < 2:
             return False, None
 
-        # Use LLM to assess ambiguity
-        ranked, interaction = await self.disambiguate(query, candidates, top_k=threshold)
+        # Use LLM to assess ambiguity (force_rank so the assessment still runs
+        # when the candidate set is no larger than the threshold)
+        ranked, interaction = await self.disambiguate(
+            query, candidates, top_k=threshold, force_rank=True
+        )
 
         if not interaction:
             return False, None
@@ -277,3 +304,26 @@ Include up to {min(top_k * 2, len(candidates))} ranked indices."""
             return True, question
 
         return False, None
+
+
+# Global service instance
+_service: DisambiguationService | None = None
+
+
+def get_disambiguation_service() -> DisambiguationService:
+    """
+    Get the global disambiguation service instance.
+
+    Creating the service builds an LLM client from config, so it is done
+    once and shared rather than per tool call.
+    """
+    global _service
+    if _service is None:
+        _service = DisambiguationService()
+    return _service
+
+
+def set_disambiguation_service(service: DisambiguationService) -> None:
+    """Set the global service instance (useful for testing)."""
+    global _service
+    _service = service
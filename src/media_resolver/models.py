@@ -58,6 +58,9 @@ class MediaCandidate(BaseModel):
 class NowPlaying(BaseModel):
     """Information about currently playing media."""
 
+    # Output-only snapshot; frozen enables pydantic's faster immutable paths
+    model_config = ConfigDict(frozen=True)
+
     title: str = Field(..., description="Track or episode title")
     artist_or_show: str | None = Field(None, description="Artist name or podcast show")
     kind: MediaKind = Field(..., description="Type of media")
@@ -70,6 +73,7 @@ class PlayPlan(BaseModel):
     """Plan for what to play and how."""
 
     model_config = ConfigDict(
+        frozen=True,
         json_schema_extra={
             "example": {
                 "playback_url": "http://icecast:8000/mopidy",
@@ -82,7 +86,7 @@ class PlayPlan(BaseModel):
                 "requires_clarification": False,
                 "total_tracks": 20,
             }
-        }
+        },
     )
 
     playback_url: str = Field(..., description="URL for Home Assistant to play (usually Icecast)")
@@ -1,14 +1,60 @@
 """Mopidy JSON-RPC client."""
 
+import itertools
+import json
 from typing import Any
 
 import httpx
 import structlog
 
 from media_resolver.models import MediaCandidate, MediaKind, NowPlaying
+from media_resolver.tracing import get_tracer
 
 logger = structlog.get_logger()
 
+# orjson is noticeably faster for the small payloads involved in RPC
+# calls; fall back to the stdlib when it is not installed.
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - depends on environment
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    _json_loads = json.loads
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+# Bind the hot enum members once; converters run per search result and the
+# repeated class-attribute lookups add up on large pages
+_TRACK = MediaKind.TRACK
+_ARTIST = MediaKind.ARTIST
+_PLAYLIST = MediaKind.PLAYLIST
+
+
+def _ms_to_sec(ms: int | None) -> int | None:
+    """Convert milliseconds to whole seconds, preserving None (but not 0)."""
+    return ms // 1000 if ms is not None else None
+
+
+def _rpc_request(request_id: int, method: str, params: dict[str, Any]) -> dict[str, Any]:
+    """Build a JSON-RPC request envelope, omitting "params" when empty.
+
+    The key is optional per the JSON-RPC 2.0 spec, and most playback-control
+    calls carry no parameters; dropping it trims serialization and wire bytes.
+    """
+    request: dict[str, Any] = {"jsonrpc": "2.0", "id": request_id, "method": method}
+    if params:
+        request["params"] = params
+    return request
+
 
 class MopidyError(Exception):
     """Base exception for Mopidy client errors."""
@@ -50,25 +96,38 @@ class MopidyClient:
         """
         self.rpc_url = rpc_url
         self.timeout = timeout
-        self._request_id = 0
+        self._id_counter = itertools.count(1)
         self._client: httpx.AsyncClient | None = None
         self._capabilities: dict[str, Any] | None = None
+        self._tracer = get_tracer(__name__)
         self.log = logger.bind(component="mopidy_client")
 
+    async def connect(self) -> None:
+        """Create the underlying HTTP client if not already connected."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(2.0, read=self.timeout),
+                limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60.0),
+            )
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client."""
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+
     async def __aenter__(self):
         """Async context manager entry."""
-        self._client = httpx.AsyncClient(timeout=self.timeout)
+        await self.connect()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if self._client:
-            await self._client.aclose()
+        await self.aclose()
 
     def _next_request_id(self) -> int:
         """Get next request ID."""
-        self._request_id += 1
-        return self._request_id
+        return next(self._id_counter)
 
     async def call(self, method: str, **params) -> Any:
         """
@@ -89,14 +148,19 @@ class MopidyClient:
             raise MopidyConnectionError("Client not initialized. Use 'async with' context manager.")
 
         request_id = self._next_request_id()
-        payload = {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+        payload = _rpc_request(request_id, method, params)
 
         self.log.debug("mopidy_rpc_call", method=method, params=params, request_id=request_id)
 
         try:
-            response = await self._client.post(self.rpc_url, json=payload)
-            response.raise_for_status()
-            data = response.json()
+            with self._tracer.start_as_current_span(
+                "mopidy.rpc", attributes={"rpc.method": method}
+            ):
+                response = await self._client.post(
+                    self.rpc_url, content=_json_dumps(payload), headers=_JSON_HEADERS
+                )
+                response.raise_for_status()
+                data = _json_loads(response.content)
         except httpx.HTTPError as e:
             self.log.error("mopidy_connection_error", error=str(e), url=self.rpc_url)
             raise MopidyConnectionError(f"Failed to connect to Mopidy: {e}") from e
@@ -120,6 +184,68 @@ class MopidyClient:
         self.log.debug("mopidy_rpc_success", method=method, result_type=type(result).__name__)
         return result
 
+    async def batch(self, calls: list[tuple[str, dict[str, Any]]]) -> list[Any]:
+        """
+        Make several JSON-RPC calls in a single HTTP request.
+
+        Mopidy supports JSON-RPC batch requests, so sequences like
+        clear/add/play can share one round trip instead of paying an RTT
+        per call.
+
+        Args:
+            calls: List of (method, params) tuples, executed in order
+
+        Returns:
+            List of results, one per call, in call order
+
+        Raises:
+            MopidyConnectionError: If connection fails
+            MopidyRPCError: If any call in the batch returns an error
+        """
+        if not self._client:
+            raise MopidyConnectionError("Client not initialized. Use 'async with' context manager.")
+
+        payload = [
+            _rpc_request(self._next_request_id(), method, params) for method, params in calls
+        ]
+
+        self.log.debug("mopidy_rpc_batch", methods=[method for method, _ in calls])
+
+        try:
+            with self._tracer.start_as_current_span(
+                "mopidy.rpc_batch", attributes={"rpc.calls": len(calls)}
+            ):
+                response = await self._client.post(
+                    self.rpc_url, content=_json_dumps(payload), headers=_JSON_HEADERS
+                )
+                response.raise_for_status()
+                data = _json_loads(response.content)
+        except httpx.HTTPError as e:
+            self.log.error("mopidy_connection_error", error=str(e), url=self.rpc_url)
+            raise MopidyConnectionError(f"Failed to connect to Mopidy: {e}") from e
+
+        # Responses may arrive in any order; realign by request id
+        by_id = {item.get("id"): item for item in data}
+        results = []
+        for request in payload:
+            item = by_id.get(request["id"], {})
+            if "error" in item:
+                error = item["error"]
+                self.log.error(
+                    "mopidy_rpc_error",
+                    method=request["method"],
+                    code=error.get("code"),
+                    message=error.get("message"),
+                )
+                raise MopidyRPCError(
+                    code=error.get("code", -1),
+                    message=error.get("message", "Unknown error"),
+                    data=error.get("data"),
+                )
+            results.append(item.get("result"))
+
+        return results
+
     # High-level API methods
 
     async def search(
@@ -143,6 +269,18 @@ class MopidyClient:
 
         return await self.call("core.library.search", **params)
 
+    async def multi_search(self, queries: list[dict[str, list[str]]]) -> list[list[dict[str, Any]]]:
+        """
+        Run several library searches in a single batched request.
+
+        Args:
+            queries: List of search query dicts (same shape as search())
+
+        Returns:
+            List of search results, one entry per query, in query order
+        """
+        return await self.batch([("core.library.search", {"query": query}) for query in queries])
+
     async def lookup(self, uris: list[str]) -> dict[str, list[dict[str, Any]]]:
         """
         Look up tracks by URI.
@@ -257,12 +395,14 @@ class MopidyClient:
         artists = track.get("artists", [])
         artist_name = artists[0].get("name") if artists else None
 
-        return MediaCandidate(
+        # Mopidy data is trusted, so skip pydantic validation; search results
+        # can run to hundreds of tracks and validation dominates the cost
+        return MediaCandidate.model_construct(
             id=track.get("uri", ""),
-            kind=MediaKind.TRACK,
+            kind=_TRACK,
             title=track.get("name", "Unknown Track"),
             subtitle=artist_name,
-            duration_sec=track.get("length", 0) // 1000 if track.get("length") else None,
+            duration_sec=_ms_to_sec(track.get("length")),
             mopidy_uri=track.get("uri"),
             score=1.0,  # Will be adjusted by disambiguation
             snippet=f"{track.get('album', {}).get('name', '')} ({track.get('date', '')})",
@@ -270,9 +410,9 @@ class MopidyClient:
 
     def artist_to_candidate(self, artist: dict[str, Any]) -> MediaCandidate:
         """Convert Mopidy artist dict to MediaCandidate."""
-        return MediaCandidate(
+        return MediaCandidate.model_construct(
             id=artist.get("uri", ""),
-            kind=MediaKind.ARTIST,
+            kind=_ARTIST,
             title=artist.get("name", "Unknown Artist"),
             mopidy_uri=artist.get("uri"),
             score=1.0,
@@ -280,9 +420,9 @@ class MopidyClient:
 
     def playlist_to_candidate(self, playlist: dict[str, Any]) -> MediaCandidate:
         """Convert Mopidy playlist dict to MediaCandidate."""
-        return MediaCandidate(
+        return MediaCandidate.model_construct(
             id=playlist.get("uri", ""),
-            kind=MediaKind.PLAYLIST,
+            kind=_PLAYLIST,
             title=playlist.get("name", "Unknown Playlist"),
             mopidy_uri=playlist.get("uri"),
             score=1.0,
@@ -295,25 +435,27 @@ class MopidyClient:
         Returns:
             NowPlaying instance or None if nothing is playing
         """
-        track = await self.get_current_track()
-        if not track:
-            return None
+        # One batched request instead of three sequential round trips
+        track, state, position_ms = await self.batch(
+            [
+                ("core.playback.get_current_track", {}),
+                ("core.playback.get_state", {}),
+                ("core.playback.get_time_position", {}),
+            ]
+        )
 
-        state = await self.get_state()
-        if state == "stopped":
+        if not track or state == "stopped":
             return None
 
         artists = track.get("artists", [])
         artist_name = artists[0].get("name") if artists else None
 
-        position_ms = await self.get_time_position()
-
-        return NowPlaying(
+        return NowPlaying.model_construct(
             title=track.get("name", "Unknown"),
             artist_or_show=artist_name,
-            kind=MediaKind.TRACK,
-            duration_sec=track.get("length", 0) // 1000 if track.get("length") else None,
-            position_sec=position_ms // 1000 if position_ms else None,
+            kind=_TRACK,
+            duration_sec=_ms_to_sec(track.get("length")),
+            position_sec=_ms_to_sec(position_ms),
             mopidy_uri=track.get("uri"),
         )
 
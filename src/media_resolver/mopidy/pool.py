@@ -0,0 +1,48 @@
+"""Shared long-lived Mopidy client.
+
+Opening a fresh MopidyClient (and its httpx connection pool) per tool call
+pays TCP/TLS setup on every MCP request. This module keeps one connected
+client for the process, created lazily on first use and closed at server
+shutdown.
+"""
+
+import asyncio
+
+import structlog
+
+from media_resolver.config import get_config
+from media_resolver.mopidy.client import MopidyClient
+
+logger = structlog.get_logger()
+
+_client: MopidyClient | None = None
+_lock = asyncio.Lock()
+
+
+async def get_mopidy() -> MopidyClient:
+    """
+    Get the shared MopidyClient, creating and connecting it on first use.
+
+    Returns:
+        Connected MopidyClient backed by a persistent httpx client
+    """
+    global _client
+    if _client is None:
+        async with _lock:
+            if _client is None:
+                config = get_config()
+                client = MopidyClient(config.mopidy.rpc_url, config.mopidy.timeout)
+                await client.connect()
+                logger.bind(component="mopidy_pool").info("mopidy_client_created")
+                _client = client
+    return _client
+
+
+async def close_mopidy() -> None:
+    """Close the shared client (called at server shutdown)."""
+    global _client
+    async with _lock:
+        if _client is not None:
+            await _client.aclose()
+            _client = None
+            logger.bind(component="mopidy_pool").info("mopidy_client_closed")
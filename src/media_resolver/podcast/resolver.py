@@ -1,13 +1,23 @@
 """High-level podcast resolution logic."""
 
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
 import structlog
 
-from media_resolver.config import Config, PodcastFeed
+from media_resolver.config import Config, PodcastFeed, get_config
 from media_resolver.models import MediaCandidate, MediaKind
 from media_resolver.podcast.rss_parser import PodcastRSSParser, RSSParserError
 
 logger = structlog.get_logger()
 
+# How long resolved feed results stay fresh. Podcast feeds update at most
+# hourly, so a few minutes saves repeated fetch+parse work without making
+# new episodes noticeably late.
+_CACHE_TTL_SEC = 300.0
+
 
 class PodcastResolverError(Exception):
     """Base exception for podcast resolver errors."""
@@ -39,6 +49,38 @@ class PodcastResolver:
             # Index by name (case-insensitive)
             self._feed_map[feed.name.lower()] = feed
 
+        # TTL cache for resolved feed results, keyed by (operation, args)
+        self._cache: dict[tuple, tuple[float, Any]] = {}
+        self._cache_lock = asyncio.Lock()
+
+    async def _cached(self, key: tuple, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return a cached result for `key`, fetching on miss or expiry.
+
+        Concurrent misses for the same key are coalesced behind a lock so
+        a popular show triggers only one feed fetch. Failed fetches are
+        not cached; the exception propagates to the caller.
+
+        Args:
+            key: Cache key identifying the operation and its arguments
+            fetch: Coroutine factory producing the value on a miss
+
+        Returns:
+            The cached or freshly fetched value
+        """
+        entry = self._cache.get(key)
+        if entry and time.monotonic() - entry[0] < _CACHE_TTL_SEC:
+            return entry[1]
+
+        async with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry and time.monotonic() - entry[0] < _CACHE_TTL_SEC:
+                return entry[1]
+
+            value = await fetch()
+            self._cache[key] = (time.monotonic(), value)
+            return value
+
     def find_feed(self, show_name: str) -> PodcastFeed | None:
         """
         Find podcast feed by show name.
@@ -90,11 +132,14 @@ class PodcastResolver:
                 f"Podcast show '{show_name}' not found. Check configuration."
             )
 
-        try:
+        async def fetch() -> MediaCandidate:
             episode = await self.rss_parser.get_latest_episode(feed.rss_url, feed.name)
             if not episode:
                 raise PodcastResolverError(f"No episodes found for '{show_name}'")
             return episode
+
+        try:
+            return await self._cached(("latest", feed.name.lower()), fetch)
         except RSSParserError as e:
             self.log.error("failed_to_get_latest", show_name=show_name, error=str(e))
             raise PodcastResolverError(f"Failed to get latest episode: {e}") from e
@@ -152,8 +197,11 @@ class PodcastResolver:
                 f"Podcast show '{show_name}' not found. Check configuration."
             )
 
-        try:
+        async def fetch() -> list[MediaCandidate]:
             return await self.rss_parser.search_episodes(feed.rss_url, query, feed.name, limit)
+
+        try:
+            return await self._cached(("search", feed.name.lower(), query, limit), fetch)
         except RSSParserError as e:
             raise PodcastResolverError(f"Failed to search episodes: {e}") from e
 
@@ -217,27 +265,30 @@ class PodcastResolver:
         if not feeds:
             return None
 
-        # Get latest episode from each feed, pick the most recent overall
-        latest_episode: MediaCandidate | None = None
-        latest_published: str | None = None
-
-        for feed in feeds:
-            try:
-                episode = await self.rss_parser.get_latest_episode(feed.rss_url, feed.name)
-                if not episode:
+        async def fetch() -> MediaCandidate | None:
+            # Get latest episode from each feed, pick the most recent overall
+            latest_episode: MediaCandidate | None = None
+            latest_published: str | None = None
+
+            for feed in feeds:
+                try:
+                    episode = await self.rss_parser.get_latest_episode(feed.rss_url, feed.name)
+                    if not episode:
+                        continue
+
+                    if latest_episode is None or (
+                        episode.published
+                        and (latest_published is None or episode.published > latest_published)
+                    ):
+                        latest_episode = episode
+                        latest_published = episode.published
+                except RSSParserError:
+                    # Skip feeds that fail
                     continue
 
-                if latest_episode is None or (
-                    episode.published
-                    and (latest_published is None or episode.published > latest_published)
-                ):
-                    latest_episode = episode
-                    latest_published = episode.published
-            except RSSParserError:
-                # Skip feeds that fail
-                continue
+            return latest_episode
 
-        return latest_episode
+        return await self._cached(("genre_latest", genre.lower()), fetch)
 
     def get_configured_shows(self) -> list[str]:
         """
@@ -259,3 +310,26 @@ class PodcastResolver:
         for feed in self.config.podcast_feeds:
             genres.update(tag.lower() for tag in feed.tags)
         return sorted(genres)
+
+
+# Global resolver instance
+_resolver: PodcastResolver | None = None
+
+
+def get_resolver() -> PodcastResolver:
+    """
+    Get the global podcast resolver instance.
+
+    Sharing one resolver across tool calls keeps its feed-result cache
+    warm instead of rebuilding state per request.
+    """
+    global _resolver
+    if _resolver is None:
+        _resolver = PodcastResolver(get_config())
+    return _resolver
+
+
+def set_resolver(resolver: PodcastResolver) -> None:
+    """Set the global resolver instance (useful for testing)."""
+    global _resolver
+    _resolver = resolver
@@ -1,17 +1,61 @@
 """RSS feed parsing for podcasts."""
 
+import asyncio
+import functools
+import hashlib
+import html
 import random
+import re
+import time
 from datetime import datetime
+from io import BytesIO
+from typing import Any
 
 import feedparser
 import httpx
 import structlog
 from dateutil import parser as date_parser
+from dateutil.tz import gettz
 
 from media_resolver.models import MediaCandidate, MediaKind
 
 logger = structlog.get_logger()
 
+# lxml tokenizes XML in C and skips feedparser's pure-Python sanitization
+# passes, which dominate parse time on large feeds; fall back to feedparser
+# when it is not installed.
+try:
+    from lxml import etree as _etree
+except ImportError:  # pragma: no cover - depends on environment
+    _etree = None
+
+# rapidfuzz runs the episode-search scoring loop in C; fall back to the
+# tiered substring heuristic when it is not installed.
+try:
+    from rapidfuzz import fuzz as _fuzz
+    from rapidfuzz import process as _fuzz_process
+except ImportError:  # pragma: no cover - depends on environment
+    _fuzz = None
+    _fuzz_process = None
+
+
+_ITUNES_NS = "{http://www.itunes.com/dtds/podcast-1.0.dtd}"
+
+# How long a fetched feed is served without revalidation, absent a saner
+# max-age from the server; conditional GETs keep even stale entries cheap
+_FEED_TTL_SEC = 300.0
+_FEED_TTL_MAX_SEC = 3600.0
+_FEED_CACHE_MAX = 64
+
+# Episode summaries only need tags dropped and entities decoded; a compiled
+# regex covers that at a fraction of the cost of a real HTML parser
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+_MAX_SNIPPET_LEN = 200
+
+# Minimum rapidfuzz WRatio (0-100) for an episode to count as a match
+_FUZZ_CUTOFF = 60.0
+
 
 class RSSParserError(Exception):
     """Base exception for RSS parsing errors."""
@@ -19,6 +63,177 @@ class RSSParserError(Exception):
     pass
 
 
+class ParsedFeed:
+    """Parsed RSS feed: channel metadata plus a list of entry dicts.
+
+    Mirrors the slice of feedparser's result surface this module consumes
+    (``feed``, ``entries``, ``bozo``) regardless of which parser produced it.
+    """
+
+    __slots__ = ("feed", "entries", "bozo", "_title_index")
+
+    def __init__(self, feed: dict[str, Any], entries: list[dict[str, Any]], bozo: bool = False):
+        self.feed = feed
+        self.entries = entries
+        self.bozo = bozo
+        self._title_index: dict[str, int] | None = None
+
+    def title_index(self) -> dict[str, int]:
+        """Map of casefolded entry title to entry position, built on first use.
+
+        Because parses are cached per URL, the index is built once per fetch
+        and shared by every exact-title lookup against the feed.
+        """
+        if self._title_index is None:
+            index: dict[str, int] = {}
+            for position, entry in enumerate(self.entries):
+                title = entry.get("title")
+                if title:
+                    index.setdefault(title.casefold(), position)
+            self._title_index = index
+        return self._title_index
+
+
+class _FeedCacheEntry:
+    """Cached parse of one feed URL plus its HTTP validators."""
+
+    __slots__ = ("feed", "etag", "last_modified", "content_hash", "expires_at")
+
+    def __init__(
+        self,
+        feed: ParsedFeed,
+        etag: str | None,
+        last_modified: str | None,
+        content_hash: bytes,
+        expires_at: float,
+    ):
+        self.feed = feed
+        self.etag = etag
+        self.last_modified = last_modified
+        self.content_hash = content_hash
+        self.expires_at = expires_at
+
+
+def _feed_ttl(headers: Any) -> float:
+    """TTL for a fetched feed, honoring a sane Cache-Control max-age."""
+    cache_control = headers.get("cache-control", "")
+    if isinstance(cache_control, str) and "max-age" in cache_control:
+        for part in cache_control.split(","):
+            part = part.strip()
+            if part.startswith("max-age="):
+                try:
+                    age = int(part[len("max-age=") :])
+                except ValueError:
+                    break
+                return min(max(float(age), 0.0), _FEED_TTL_MAX_SEC)
+    return _FEED_TTL_SEC
+
+
+# dateutil otherwise guesses at the timezone abbreviations common in RSS
+# pubDate fields; a prebuilt table skips that per-call search
+_TZINFOS = {
+    "UT": gettz("UTC"),
+    "GMT": gettz("UTC"),
+    "EST": gettz("US/Eastern"),
+    "EDT": gettz("US/Eastern"),
+    "CST": gettz("US/Central"),
+    "CDT": gettz("US/Central"),
+    "MST": gettz("US/Mountain"),
+    "MDT": gettz("US/Mountain"),
+    "PST": gettz("US/Pacific"),
+    "PDT": gettz("US/Pacific"),
+}
+
+
+# Feeds repeat publish timestamps across refreshes, so cache hit rates are
+# high on polling workloads; struct_time is immutable and safe to share
+@functools.lru_cache(maxsize=4096)
+def _parse_date(value: str | None) -> time.struct_time | None:
+    """Parse an RSS date string into a UTC struct_time, or None on failure."""
+    if not value:
+        return None
+    try:
+        return date_parser.parse(value, tzinfos=_TZINFOS).utctimetuple()
+    except (ValueError, OverflowError, TypeError):
+        return None
+
+
+def _item_to_entry(item: Any) -> dict[str, Any]:
+    """Convert an lxml <item> element to a feedparser-style entry dict."""
+    enclosures = []
+    for enc in item.findall("enclosure"):
+        enclosure = {"href": enc.get("url"), "type": enc.get("type", "")}
+        length = enc.get("length")
+        if length is not None:
+            enclosure["length"] = length
+        enclosures.append(enclosure)
+
+    published = item.findtext("pubDate")
+    entry = {
+        "title": item.findtext("title"),
+        "summary": item.findtext("description"),
+        "id": item.findtext("guid"),
+        "author": item.findtext("author") or item.findtext(_ITUNES_NS + "author"),
+        "published": published,
+        "published_parsed": _parse_date(published),
+    }
+    # Match feedparser, which omits keys for absent elements
+    entry = {key: value for key, value in entry.items() if value is not None}
+    entry["enclosures"] = enclosures
+    return entry
+
+
+def _channel_to_feed(channel: Any) -> dict[str, Any]:
+    """Convert an lxml <channel> element to a feedparser-style feed dict."""
+    itunes_author = channel.findtext(_ITUNES_NS + "author")
+    description = channel.findtext("description")
+    feed = {
+        "title": channel.findtext("title"),
+        "link": channel.findtext("link"),
+        "author": itunes_author or channel.findtext("managingEditor"),
+        "itunes_author": itunes_author,
+        "subtitle": description,
+        "description": description,
+    }
+    return {key: value for key, value in feed.items() if value is not None}
+
+
+def _parse_feed_bytes(data: bytes) -> ParsedFeed:
+    """Parse RSS bytes incrementally with lxml.
+
+    Items are converted to plain dicts as their end tags arrive and cleared
+    immediately, so peak memory stays independent of feed length.
+    """
+    entries: list[dict[str, Any]] = []
+    context = _etree.iterparse(BytesIO(data), events=("end",), recover=True, huge_tree=False)
+    for _, elem in context:
+        if elem.tag == "item":
+            entries.append(_item_to_entry(elem))
+            elem.clear()
+
+    root = context.root
+    channel = root.find("channel") if root is not None else None
+    feed = _channel_to_feed(channel) if channel is not None else {}
+    return ParsedFeed(feed=feed, entries=entries, bozo=root is None)
+
+
+def _parse_feed(data: bytes) -> ParsedFeed:
+    """Parse feed bytes, preferring lxml and falling back to feedparser."""
+    if _etree is not None:
+        try:
+            parsed = _parse_feed_bytes(data)
+        except _etree.Error:
+            parsed = None
+        # The lxml walk only understands RSS; Atom and other formats come
+        # back empty and are handed to feedparser, which speaks them all
+        if parsed is not None and (parsed.entries or parsed.feed):
+            return parsed
+    # Sanitization and URI resolution are feedparser's two hottest
+    # pure-Python passes and entry_to_candidate strips markup itself
+    parsed = feedparser.parse(data, resolve_relative_uris=False, sanitize_html=False)
+    return ParsedFeed(feed=parsed.feed, entries=parsed.entries, bozo=bool(parsed.bozo))
+
+
 class PodcastRSSParser:
     """
     Parser for podcast RSS feeds.
@@ -26,53 +241,127 @@ class PodcastRSSParser:
     Handles fetching and parsing RSS feeds to extract episode information.
     """
 
-    def __init__(self, timeout: int = 10):
+    def __init__(self, timeout: int = 10, client: httpx.AsyncClient | None = None):
         """
         Initialize RSS parser.
 
         Args:
             timeout: HTTP request timeout in seconds
+            client: Optional HTTP client to use; when omitted, a pooled
+                client is created lazily and owned by this parser
         """
         self.timeout = timeout
         self.log = logger.bind(component="rss_parser")
-
-    async def fetch_feed(self, rss_url: str) -> feedparser.FeedParserDict:
+        self._client = client
+        self._owns_client = client is None
+        # Parsed feeds keyed by URL, revalidated with conditional GETs
+        self._feed_cache: dict[str, _FeedCacheEntry] = {}
+        self._feed_lock = asyncio.Lock()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(5.0, read=self.timeout),
+                limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60.0),
+                follow_redirects=True,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the HTTP client, if this parser owns it."""
+        if self._client and self._owns_client:
+            await self._client.aclose()
+            self._client = None
+
+    async def fetch_feed(self, rss_url: str) -> ParsedFeed:
         """
-        Fetch and parse an RSS feed.
+        Fetch and parse an RSS feed, serving cached parses while fresh.
+
+        Within the TTL the cached parse is returned without any I/O; after
+        it, a conditional GET revalidates the entry so an unchanged feed
+        costs one 304 round trip and zero parse work.
 
         Args:
             rss_url: URL of the RSS feed
 
         Returns:
-            Parsed feed dict
+            Parsed feed
 
         Raises:
             RSSParserError: If fetching or parsing fails
         """
+        cached = self._feed_cache.get(rss_url)
+        if cached and cached.expires_at > time.monotonic():
+            return cached.feed
+
+        async with self._feed_lock:
+            # Re-check: another task may have refreshed while we waited
+            cached = self._feed_cache.get(rss_url)
+            if cached and cached.expires_at > time.monotonic():
+                return cached.feed
+            return await self._refresh_feed(rss_url, cached)
+
+    async def _refresh_feed(self, rss_url: str, cached: _FeedCacheEntry | None) -> ParsedFeed:
+        """Fetch `rss_url` (conditionally, if previously cached) and cache the parse."""
         self.log.debug("fetching_feed", url=rss_url)
 
+        headers = {}
+        if cached:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
         try:
-            async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True) as client:
-                response = await client.get(rss_url)
-                response.raise_for_status()
-                feed_content = response.text
+            client = self._get_client()
+            response = await client.get(rss_url, headers=headers or None)
+            if cached and response.status_code == 304:
+                # Unchanged upstream: renew the lease on the cached parse
+                cached.expires_at = time.monotonic() + _feed_ttl(response.headers)
+                self.log.debug("feed_not_modified", url=rss_url)
+                return cached.feed
+            response.raise_for_status()
+            # Raw bytes: the parsers honor the feed's own encoding
+            # declaration, which response.text would pre-decode away
+            body = response.content
         except httpx.HTTPError as e:
             self.log.error("feed_fetch_error", url=rss_url, error=str(e))
             raise RSSParserError(f"Failed to fetch RSS feed: {e}") from e
 
-        # Parse with feedparser
-        feed = feedparser.parse(feed_content)
+        content_hash = hashlib.sha1(body).digest()
+        if cached and cached.content_hash == content_hash:
+            # Some servers ignore validators and resend identical bodies on
+            # 200; the hash check still lets us skip the reparse
+            feed = cached.feed
+        else:
+            feed = _parse_feed(body)
 
         if feed.bozo:
             # Feed has parsing errors
-            self.log.warning("feed_parse_warning", url=rss_url, error=feed.bozo_exception)
+            self.log.warning("feed_parse_warning", url=rss_url)
 
         if not feed.entries:
             self.log.warning("empty_feed", url=rss_url)
 
+        if rss_url not in self._feed_cache and len(self._feed_cache) >= _FEED_CACHE_MAX:
+            # Drop the oldest entry to cap memory on long-running servers
+            self._feed_cache.pop(next(iter(self._feed_cache)))
+        self._feed_cache[rss_url] = _FeedCacheEntry(
+            feed=feed,
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+            content_hash=content_hash,
+            expires_at=time.monotonic() + _feed_ttl(response.headers),
+        )
+
         self.log.info("feed_fetched", url=rss_url, entries=len(feed.entries))
         return feed
 
+    def invalidate(self, rss_url: str) -> None:
+        """Drop the cached parse for a feed URL, forcing a full refetch."""
+        self._feed_cache.pop(rss_url, None)
+
     def entry_to_candidate(
         self, entry: dict, show_name: str | None = None
     ) -> MediaCandidate | None:
@@ -119,25 +408,25 @@ class PodcastRSSParser:
                 pass
 
         if not published and "published" in entry:
-            try:
-                dt = date_parser.parse(entry["published"])
-                published = dt.isoformat()
-            except Exception:
-                pass
+            parsed = _parse_date(entry["published"])
+            if parsed:
+                published = datetime(*parsed[:6]).isoformat()
 
-        # Get description/summary
+        # Get description/summary, stripped of markup and truncated up front.
+        # Most summaries are plain text; a byte scan for markup is far
+        # cheaper than always running the regexes.
         snippet = entry.get("summary", entry.get("description", ""))
-        # Clean HTML tags if present (basic cleanup)
         if snippet:
-            import re
-
-            snippet = re.sub(r"<[^>]+>", "", snippet)
-            snippet = snippet[:200]  # Limit length
+            if "<" in snippet or "&" in snippet:
+                snippet = _WS_RE.sub(" ", html.unescape(_TAG_RE.sub("", snippet))).strip()
+            snippet = snippet[:_MAX_SNIPPET_LEN]
 
         # Use audio URL as ID (some feeds don't have GUIDs)
         episode_id = entry.get("id", entry.get("guid", audio_url))
 
-        return MediaCandidate(
+        # Feed data is normalized above, so skip pydantic validation; search
+        # converts every entry and validation dominates small-object cost
+        return MediaCandidate.model_construct(
             id=episode_id,
             kind=MediaKind.PODCAST_EPISODE,
             title=title,
@@ -227,24 +516,51 @@ class PodcastRSSParser:
 
         query_lower = query.lower()
         show_title = show_name or feed.feed.get("title")
-        matches: list[tuple[MediaCandidate, float]] = []
 
+        # An exact title match pre-empts candidate conversion and fuzzy
+        # scoring entirely; the index lives with the cached parse
+        position = feed.title_index().get(query.casefold())
+        if position is not None:
+            candidate = self.entry_to_candidate(feed.entries[position], show_title)
+            if candidate:
+                candidate.score = 1.0
+                return [candidate]
+
+        candidates = []
         for entry in feed.entries:
             candidate = self.entry_to_candidate(entry, show_title)
-            if not candidate:
-                continue
+            if candidate:
+                candidates.append(candidate)
+
+        if _fuzz_process is not None:
+            choices = [f"{c.title} {c.snippet}" if c.snippet else c.title for c in candidates]
+            scored = _fuzz_process.extract(
+                query, choices, scorer=_fuzz.WRatio, limit=limit, score_cutoff=_FUZZ_CUTOFF
+            )
+            results = []
+            for _, score, index in scored:  # already sorted by score descending
+                candidate = candidates[index]
+                candidate.score = score / 100.0
+                results.append(candidate)
+            return results
+
+        return self._search_fallback(candidates, query_lower, limit)
+
+    @staticmethod
+    def _search_fallback(
+        candidates: list[MediaCandidate], query_lower: str, limit: int
+    ) -> list[MediaCandidate]:
+        """Tiered substring scoring, used when rapidfuzz is unavailable."""
+        matches: list[tuple[MediaCandidate, float]] = []
 
-            # Calculate relevance score
+        for candidate in candidates:
             score = 0.0
 
             title_lower = candidate.title.lower()
             snippet_lower = (candidate.snippet or "").lower()
 
-            # Exact title match
-            if query_lower == title_lower:
-                score = 1.0
             # Title contains query
-            elif query_lower in title_lower:
+            if query_lower in title_lower:
                 score = 0.8
             # Description contains query
             elif query_lower in snippet_lower:
@@ -291,11 +607,11 @@ class PodcastRSSParser:
         subtitle = feed.feed.get("author", feed.feed.get("itunes_author"))
         description = feed.feed.get("subtitle", feed.feed.get("description", ""))
 
-        return MediaCandidate(
+        return MediaCandidate.model_construct(
             id=rss_url,
             kind=MediaKind.PODCAST_SHOW,
             title=title,
             subtitle=subtitle,
-            snippet=description[:200] if description else None,
+            snippet=description[:_MAX_SNIPPET_LEN] if description else None,
             score=1.0,
         )
@@ -20,20 +20,26 @@ class RequestLogger:
     Tracks all MCP tool invocations with their inputs, outputs, and LLM interactions.
     """
 
-    def __init__(self, max_size: int | None = None):
+    def __init__(self, max_size: int | None = None, enabled: bool | None = None):
         """
         Initialize request logger.
 
         Args:
             max_size: Maximum number of requests to keep. If None, uses config.
+            enabled: Whether to record requests. If None, uses config. Callers
+                can check `enabled` to skip building log payloads entirely.
         """
-        if max_size is None:
+        if max_size is None or enabled is None:
             config = get_config()
-            max_size = config.max_request_history
+            if max_size is None:
+                max_size = config.max_request_history
+            if enabled is None:
+                enabled = config.request_logging_enabled
 
+        self.enabled = enabled
         self._logs: deque[RequestLog] = deque(maxlen=max_size)
         self.log = logger.bind(component="request_logger")
-        self.log.info("request_logger_initialized", max_size=max_size)
+        self.log.info("request_logger_initialized", max_size=max_size, enabled=enabled)
 
     def log_request(
         self,
@@ -60,11 +66,16 @@ class RequestLogger:
             mopidy_search_results: Number of Mopidy search results
 
         Returns:
-            Request ID
+            Request ID, or an empty string when logging is disabled
         """
+        if not self.enabled:
+            return ""
+
         request_id = f"req_{uuid.uuid4().hex[:12]}"
 
-        request_log = RequestLog(
+        # All fields are already validated/typed by the callers, so skip
+        # the pydantic validator pipeline on this hot path.
+        request_log = RequestLog.model_construct(
             timestamp=datetime.now(),
             request_id=request_id,
             tool_name=tool_name,
@@ -1,6 +1,8 @@
 """FastMCP server entry point for Media Resolver."""
 
 import logging
+import logging.handlers
+import queue
 from contextlib import asynccontextmanager
 
 import structlog
@@ -9,39 +11,81 @@ from fastapi import FastAPI
 from fastmcp import FastMCP
 
 from media_resolver.admin.routes import create_admin_app
-from media_resolver.config import get_config, load_config
+from media_resolver.config import get_config
 from media_resolver.mopidy.capabilities import get_capabilities
-from media_resolver.mopidy.client import MopidyClient
+from media_resolver.mopidy.pool import close_mopidy, get_mopidy
 from media_resolver.tools import music, playback, podcast
 
-# Initialize structured logging
-structlog.configure(
-    processors=[
-        structlog.contextvars.merge_contextvars,
-        structlog.processors.add_log_level,
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.JSONRenderer(),
-    ],
-    wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
-    context_class=dict,
-    logger_factory=structlog.PrintLoggerFactory(),
-    cache_logger_on_first_use=False,
-)
+# Render JSON responses with orjson when installed; ORJSONResponse itself
+# imports fine without it but fails at render time, so gate on the package.
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as _DefaultJSONResponse
+except ImportError:  # pragma: no cover - depends on environment
+    from fastapi.responses import JSONResponse as _DefaultJSONResponse
+
+
+def setup_logging() -> logging.handlers.QueueListener:
+    """
+    Initialize structured logging with a non-blocking queue handler.
+
+    Tool functions log several times per request; rendering and writing
+    those records synchronously would block the event loop. Records are
+    instead enqueued by a QueueHandler and drained by a QueueListener
+    thread, which runs the JSON rendering and stdout write off the
+    request path.
+
+    Returns:
+        The QueueListener; callers must start() it before logs flow
+        and stop() it on shutdown.
+    """
+    log_queue: queue.Queue = queue.Queue(-1)
+
+    formatter = structlog.stdlib.ProcessorFormatter(
+        processors=[
+            structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+            structlog.processors.JSONRenderer(),
+        ],
+    )
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+
+    root = logging.getLogger()
+    root.handlers.clear()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+
+    structlog.configure(
+        processors=[
+            structlog.contextvars.merge_contextvars,
+            structlog.processors.add_log_level,
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+        ],
+        wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
+        context_class=dict,
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        cache_logger_on_first_use=True,
+    )
+
+    return logging.handlers.QueueListener(log_queue, stream_handler)
+
+
+_log_listener = setup_logging()
 
 logger = structlog.get_logger()
 
 
 async def detect_mopidy_capabilities():
     """Detect and store Mopidy backend capabilities at startup."""
-    config = get_config()
     log = logger.bind(component="startup")
 
     try:
         log.info("detecting_mopidy_capabilities")
-        async with MopidyClient(config.mopidy.rpc_url, config.mopidy.timeout) as mopidy:
-            capabilities = await mopidy.detect_capabilities()
-            get_capabilities().set_capabilities(capabilities)
-            log.info("capabilities_detected", capabilities=capabilities)
+        mopidy = await get_mopidy()
+        capabilities = await mopidy.detect_capabilities()
+        get_capabilities().set_capabilities(capabilities)
+        log.info("capabilities_detected", capabilities=capabilities)
     except Exception as e:
         log.warning("capability_detection_failed", error=str(e))
         log.info("continuing_with_limited_capabilities")
@@ -230,11 +274,13 @@ async def play_podcast_by_genre(genre: str, mode: str = "replace"):
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for startup/shutdown."""
+    _log_listener.start()
+
     log = logger.bind(component="server")
     log.info("server_starting")
 
-    # Load configuration
-    config = load_config()
+    # Load configuration (parsed once; later get_config() calls hit the cache)
+    config = get_config()
     log.info("configuration_loaded", config_summary={"llm_provider": config.llm.provider})
 
     # Detect Mopidy capabilities
@@ -245,6 +291,8 @@ async def lifespan(app: FastAPI):
     yield
 
     log.info("server_shutting_down")
+    await close_mopidy()
+    _log_listener.stop()
 
 
 def create_app() -> FastAPI:
@@ -255,6 +303,7 @@ def create_app() -> FastAPI:
         description="MCP server for resolving and playing media via Mopidy",
         version="0.1.0",
         lifespan=lifespan,
+        default_response_class=_DefaultJSONResponse,
     )
 
     # Mount MCP server
@@ -281,7 +330,7 @@ def create_app() -> FastAPI:
 
 def main():
     """Main entry point."""
-    config = load_config()
+    config = get_config()
 
     log = logger.bind(component="main")
     log.info(
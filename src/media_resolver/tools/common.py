@@ -0,0 +1,107 @@
+"""Shared scaffolding for MCP tool functions."""
+
+import time
+from collections.abc import Awaitable, Callable
+from functools import wraps
+from inspect import signature
+from typing import Any
+
+import structlog
+
+from media_resolver.models import PlaybackMode
+from media_resolver.request_logger import RequestStatus, get_request_logger
+
+logger = structlog.get_logger()
+
+# Fast mode-string lookup; enum construction by value scans members on miss
+_MODE_MAP = {member.value: member for member in PlaybackMode}
+
+# Shared empty dict for error-path log_request output; treated as immutable
+_EMPTY: dict = {}
+
+# Maps exception type -> (error_code, retryable)
+ErrorMap = dict[type[Exception], tuple[str, bool]]
+
+ToolFunc = Callable[..., Awaitable[dict]]
+
+
+def tool_handler(name: str, error_map: ErrorMap | None = None) -> Callable[[ToolFunc], ToolFunc]:
+    """
+    Wrap a tool coroutine with timing, request logging, and error mapping.
+
+    Centralizes the scaffolding every tool used to repeat: sampling the
+    clock, recording the call with the request logger, and converting
+    domain exceptions into the standard
+    ``{"error_code", "message", "retryable"}`` dict. The wrapped function
+    keeps only the business logic; it may still return an error dict
+    directly (e.g. for input validation), which is recorded as an error.
+
+    Args:
+        name: Tool name used for request logging
+        error_map: Maps exception types to (error_code, retryable) pairs.
+            Subclasses match via the exception's MRO; unmapped exceptions
+            become "unexpected_error"
+
+    Returns:
+        Decorator for the tool coroutine
+    """
+    errors = error_map or {}
+    # Pre-build the static part of each error dict so exception paths only
+    # add the message.
+    templates = {
+        klass: {"error_code": code, "retryable": retryable}
+        for klass, (code, retryable) in errors.items()
+    }
+    unexpected = {"error_code": "unexpected_error", "retryable": False}
+
+    def decorator(func: ToolFunc) -> ToolFunc:
+        sig = signature(func)
+        log = logger.bind(tool=name)
+
+        def bound_params(args: tuple, kwargs: dict) -> dict[str, Any]:
+            bound = sig.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return dict(bound.arguments)
+
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> dict:
+            request_logger = get_request_logger()
+            start_ns = time.perf_counter_ns() if request_logger.enabled else 0
+
+            try:
+                result = await func(*args, **kwargs)
+            except Exception as e:
+                for klass in type(e).__mro__:
+                    if klass in templates:
+                        template = templates[klass]
+                        break
+                else:
+                    template = unexpected
+
+                log.error("tool_failed", error_code=template["error_code"], error=str(e))
+                if request_logger.enabled:
+                    request_logger.log_request(
+                        tool_name=name,
+                        input_params=bound_params(args, kwargs),
+                        output=_EMPTY,
+                        status=RequestStatus.ERROR,
+                        total_latency_ms=(time.perf_counter_ns() - start_ns) // 1_000_000,
+                        error_message=str(e),
+                    )
+                return {**template, "message": str(e)}
+
+            if request_logger.enabled:
+                failed = "error_code" in result
+                request_logger.log_request(
+                    tool_name=name,
+                    input_params=bound_params(args, kwargs),
+                    output=_EMPTY if failed else result,
+                    status=RequestStatus.ERROR if failed else RequestStatus.SUCCESS,
+                    total_latency_ms=(time.perf_counter_ns() - start_ns) // 1_000_000,
+                    error_message=result.get("message") if failed else None,
+                )
+            return result
+
+        return wrapper
+
+    return decorator
@@ -1,6 +1,8 @@
 """Music-related MCP tools."""
 
 import time
+import unicodedata
+from itertools import chain, islice
 
 import structlog
 
@@ -9,11 +11,162 @@ from media_resolver.disambiguation.service import DisambiguationService
 from media_resolver.models import MediaCandidate, MediaKind, NowPlaying, PlaybackMode, PlayPlan
 from media_resolver.mopidy.capabilities import get_capabilities
 from media_resolver.mopidy.client import MopidyClient, MopidyError
+from media_resolver.mopidy.pool import get_mopidy
 from media_resolver.request_logger import RequestStatus, get_request_logger
+from media_resolver.tools.common import _MODE_MAP
 
 logger = structlog.get_logger()
 
 
+def _dedupe_candidates(candidates: list[MediaCandidate]) -> list[MediaCandidate]:
+    """
+    Remove duplicate candidates that differ only by backend URI.
+
+    Multiple Mopidy backends often return the same artist or track under
+    different URIs. Deduplicating by (title, subtitle) before disambiguation
+    keeps the LLM prompt small. The first occurrence wins, which preserves
+    backend ordering from the search results.
+
+    Args:
+        candidates: Candidates collected across backends
+
+    Returns:
+        Candidates with duplicates removed, original order preserved
+    """
+    seen: set[tuple[str, str]] = set()
+    deduped = []
+    for candidate in candidates:
+        key = (candidate.title.casefold(), (candidate.subtitle or "").casefold())
+        if key not in seen:
+            seen.add(key)
+            deduped.append(candidate)
+    return deduped
+
+
+def _first_artist_name(track: dict) -> str | None:
+    """
+    Get the first artist name from a Mopidy track dict.
+
+    Avoids the `get("artists", [{}])[0]` idiom, which allocates a throwaway
+    list on every track without artists.
+    """
+    artists = track.get("artists")
+    return artists[0].get("name") if artists else None
+
+
+def _normalize_title(title: str) -> str:
+    """
+    Normalize a title for exact-match comparison.
+
+    Strips diacritics (NFKD decomposition, drop combining marks) and
+    case-folds, so 'Beyoncé' matches 'beyonce'.
+    """
+    decomposed = unicodedata.normalize("NFKD", title)
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return stripped.casefold()
+
+
+def _find_exact_match(query: str, candidates: list[MediaCandidate]) -> MediaCandidate | None:
+    """
+    Find the single candidate whose title exactly matches the query.
+
+    When exactly one candidate matches after normalization, disambiguation
+    is unnecessary and the LLM round trip can be skipped entirely. Returns
+    None when zero or multiple candidates match, since those cases still
+    need ranking.
+
+    Args:
+        query: Original user query
+        candidates: Candidate list from search
+
+    Returns:
+        The unique exact match, or None
+    """
+    query_norm = _normalize_title(query)
+    exact = [c for c in candidates if _normalize_title(c.title) == query_norm]
+    if len(exact) == 1:
+        return exact[0]
+    return None
+
+
+def _lexical_score(query_cf: str, candidate: MediaCandidate) -> float:
+    """
+    Score a candidate against a case-folded query using cheap lexical matching.
+
+    Mirrors the scoring used by PodcastResolver.search_shows: exact title
+    match beats substring match beats word overlap.
+    """
+    title_cf = candidate.title.casefold()
+    text_cf = f"{title_cf} {(candidate.subtitle or '').casefold()}"
+
+    if query_cf == title_cf:
+        return 1.0
+    if query_cf in text_cf:
+        return 0.8
+
+    query_words = query_cf.split()
+    text_words = set(text_cf.split())
+    matched = sum(1 for word in query_words if word in text_words)
+    if matched > 0:
+        return 0.5 * (matched / len(query_words))
+    return 0.0
+
+
+def _prefilter(query: str, candidates: list[MediaCandidate], k: int = 30) -> list[MediaCandidate]:
+    """
+    Lexically prefilter candidates before LLM disambiguation.
+
+    The LLM call dominates latency and its cost scales with candidate count,
+    so narrow large candidate lists to the top k lexical matches first
+    (retrieval then rerank). Sorting is stable, so equally scored candidates
+    keep their backend order.
+
+    Args:
+        query: Original user query
+        candidates: Full candidate list from search
+        k: Maximum number of candidates to keep
+
+    Returns:
+        Top k candidates by lexical score
+    """
+    if len(candidates) <= k:
+        return candidates
+
+    query_cf = query.casefold()
+    ranked = sorted(candidates, key=lambda c: _lexical_score(query_cf, c), reverse=True)
+    return ranked[:k]
+
+
+_ADD_TRACKS_CHUNK_SIZE = 200
+
+
+async def _add_tracks_chunked(
+    mopidy: MopidyClient,
+    uris: list[str],
+    play_after_first: bool = False,
+    chunk_size: int = _ADD_TRACKS_CHUNK_SIZE,
+) -> None:
+    """
+    Add track URIs to the tracklist in bounded chunks.
+
+    A single core.tracklist.add call with thousands of URIs produces one
+    giant JSON-RPC payload and blocks Mopidy while it processes it.
+    Chunking keeps each request small, and with play_after_first playback
+    starts as soon as the first chunk is queued instead of after the full
+    list has loaded.
+
+    Args:
+        mopidy: Connected Mopidy client
+        uris: Track URIs to add
+        play_after_first: Start playback once the first chunk is queued
+        chunk_size: Maximum URIs per RPC call
+    """
+    for start in range(0, len(uris), chunk_size):
+        await mopidy.add_tracks(uris[start : start + chunk_size])
+        if play_after_first and start == 0:
+            await mopidy.play()
+
+
 async def play_music_by_artist(
     artist: str, mode: str = "replace", limit: int = 50, shuffle: bool = True
 ) -> dict:
@@ -36,9 +189,8 @@ async def play_music_by_artist(
     config = get_config()
     input_params = {"artist": artist, "mode": mode, "limit": limit, "shuffle": shuffle}
 
-    try:
-        playback_mode = PlaybackMode(mode)
-    except ValueError:
+    playback_mode = _MODE_MAP.get(mode)
+    if playback_mode is None:
         error_msg = f"Invalid mode: {mode}. Must be 'replace' or 'enqueue'"
         request_logger.log_request(
             tool_name="play_music_by_artist",
@@ -51,122 +203,129 @@ async def play_music_by_artist(
         return {"error_code": "invalid_mode", "message": error_msg, "retryable": False}
 
     try:
-        async with MopidyClient(config.mopidy.rpc_url, config.mopidy.timeout) as mopidy:
-            # Search for artist
-            log.info("searching_artist")
-            results = await mopidy.search(query={"artist": [artist]})
-
-            # Collect artist candidates from all backends
-            artist_candidates: list[MediaCandidate] = []
-            for backend_result in results:
-                for artist_result in backend_result.get("artists", []):
-                    candidate = mopidy.artist_to_candidate(artist_result)
-                    artist_candidates.append(candidate)
-
-            if not artist_candidates:
-                error_msg = f"No artist found matching '{artist}'"
-                latency_ms = int((time.time() - start_time) * 1000)
-                request_logger.log_request(
-                    tool_name="play_music_by_artist",
-                    input_params=input_params,
-                    output={},
-                    status=RequestStatus.ERROR,
-                    total_latency_ms=latency_ms,
-                    error_message=error_msg,
-                    mopidy_search_results=0,
-                )
-                return {"error_code": "not_found", "message": error_msg, "retryable": False}
+        mopidy = await get_mopidy()
+        # Search for artist
+        log.info("searching_artist")
+        results = await mopidy.search(query={"artist": [artist]})
+
+        # Collect artist candidates from all backends
+        artist_candidates = _dedupe_candidates(
+            [
+                mopidy.artist_to_candidate(artist_result)
+                for backend_result in results
+                for artist_result in backend_result.get("artists", [])
+            ]
+        )
 
-            log.info("found_artists", count=len(artist_candidates))
+        if not artist_candidates:
+            error_msg = f"No artist found matching '{artist}'"
+            latency_ms = int((time.time() - start_time) * 1000)
+            request_logger.log_request(
+                tool_name="play_music_by_artist",
+                input_params=input_params,
+                output={},
+                status=RequestStatus.ERROR,
+                total_latency_ms=latency_ms,
+                error_message=error_msg,
+                mopidy_search_results=0,
+            )
+            return {"error_code": "not_found", "message": error_msg, "retryable": False}
 
-            # Disambiguate if multiple artists
-            llm_interaction = None
-            selected_artist = artist_candidates[0]
+        log.info("found_artists", count=len(artist_candidates))
 
-            if len(artist_candidates) > 1:
+        # Disambiguate if multiple artists
+        llm_interaction = None
+        selected_artist = artist_candidates[0]
+
+        if len(artist_candidates) > 1:
+            exact_match = _find_exact_match(artist, artist_candidates)
+            if exact_match is not None:
+                log.info("exact_artist_match_skipping_disambiguation")
+                selected_artist = exact_match
+            else:
                 log.info("disambiguating_artists")
                 disambiguator = DisambiguationService()
                 ranked, llm_interaction = await disambiguator.disambiguate(
                     query=artist,
-                    candidates=artist_candidates,
+                    candidates=_prefilter(artist, artist_candidates),
                     context={"search_type": "artist"},
                     top_k=1,
                 )
                 if ranked:
                     selected_artist = ranked[0]
 
-            # Get tracks for artist (search for tracks by this artist)
-            log.info("fetching_tracks", artist_uri=selected_artist.mopidy_uri)
-            track_results = await mopidy.search(query={"artist": [selected_artist.title]})
-
-            # Collect tracks
-            tracks = []
-            for backend_result in track_results:
-                tracks.extend(backend_result.get("tracks", []))
-
-            if not tracks:
-                error_msg = f"No tracks found for artist '{selected_artist.title}'"
-                latency_ms = int((time.time() - start_time) * 1000)
-                request_logger.log_request(
-                    tool_name="play_music_by_artist",
-                    input_params=input_params,
-                    output={},
-                    status=RequestStatus.ERROR,
-                    total_latency_ms=latency_ms,
-                    error_message=error_msg,
-                    llm_interaction=llm_interaction,
-                    mopidy_search_results=len(artist_candidates),
-                )
-                return {"error_code": "no_tracks", "message": error_msg, "retryable": False}
-
-            # Limit tracks
-            tracks = tracks[:limit]
-            track_uris = [track["uri"] for track in tracks]
-
-            log.info("queuing_tracks", count=len(track_uris))
-
-            # Clear and add to queue
-            if playback_mode == PlaybackMode.REPLACE:
-                await mopidy.clear_tracklist()
-
-            await mopidy.add_tracks(track_uris)
-
-            if shuffle:
-                await mopidy.shuffle_tracklist()
+        # Get tracks for artist (search for tracks by this artist)
+        log.info("fetching_tracks", artist_uri=selected_artist.mopidy_uri)
+        track_results = await mopidy.search(query={"artist": [selected_artist.title]})
 
-            await mopidy.play()
-
-            # Get now playing
-            now_playing = await mopidy.get_now_playing()
-            if not now_playing:
-                now_playing = NowPlaying(
-                    title=tracks[0].get("name", "Unknown"),
-                    artist_or_show=selected_artist.title,
-                    kind=MediaKind.TRACK,
-                )
-
-            # Build result
-            plan = PlayPlan(
-                playback_url=config.icecast.stream_url,
-                now_playing=now_playing,
-                total_tracks=len(track_uris),
+        # Collect up to `limit` tracks in a single bounded pass
+        tracks = list(
+            islice(
+                chain.from_iterable(br.get("tracks", ()) for br in track_results),
+                limit,
             )
+        )
 
+        if not tracks:
+            error_msg = f"No tracks found for artist '{selected_artist.title}'"
             latency_ms = int((time.time() - start_time) * 1000)
             request_logger.log_request(
                 tool_name="play_music_by_artist",
                 input_params=input_params,
-                output=plan.model_dump(),
-                status=RequestStatus.SUCCESS,
+                output={},
+                status=RequestStatus.ERROR,
                 total_latency_ms=latency_ms,
+                error_message=error_msg,
                 llm_interaction=llm_interaction,
                 mopidy_search_results=len(artist_candidates),
             )
+            return {"error_code": "no_tracks", "message": error_msg, "retryable": False}
+
+        track_uris = [track["uri"] for track in tracks]
+
+        log.info("queuing_tracks", count=len(track_uris))
 
-            log.info(
-                "artist_playback_started", artist=selected_artist.title, tracks=len(track_uris)
+        # Clear and add to queue
+        if playback_mode == PlaybackMode.REPLACE:
+            await mopidy.clear_tracklist()
+
+        if shuffle:
+            await _add_tracks_chunked(mopidy, track_uris)
+            await mopidy.shuffle_tracklist()
+            await mopidy.play()
+        else:
+            await _add_tracks_chunked(mopidy, track_uris, play_after_first=True)
+
+        # Get now playing
+        now_playing = await mopidy.get_now_playing()
+        if not now_playing:
+            now_playing = NowPlaying(
+                title=tracks[0].get("name", "Unknown"),
+                artist_or_show=selected_artist.title,
+                kind=MediaKind.TRACK,
             )
-            return plan.model_dump()
+
+        # Build result
+        plan = PlayPlan(
+            playback_url=config.icecast.stream_url,
+            now_playing=now_playing,
+            total_tracks=len(track_uris),
+        )
+
+        dumped = plan.model_dump()
+        latency_ms = int((time.time() - start_time) * 1000)
+        request_logger.log_request(
+            tool_name="play_music_by_artist",
+            input_params=input_params,
+            output=dumped,
+            status=RequestStatus.SUCCESS,
+            total_latency_ms=latency_ms,
+            llm_interaction=llm_interaction,
+            mopidy_search_results=len(artist_candidates),
+        )
+
+        log.info("artist_playback_started", artist=selected_artist.title, tracks=len(track_uris))
+        return dumped
 
     except MopidyError as e:
         latency_ms = int((time.time() - start_time) * 1000)
@@ -214,9 +373,8 @@ async def play_playlist(name: str, mode: str = "replace", shuffle: bool = False)
     config = get_config()
     input_params = {"name": name, "mode": mode, "shuffle": shuffle}
 
-    try:
-        playback_mode = PlaybackMode(mode)
-    except ValueError:
+    playback_mode = _MODE_MAP.get(mode)
+    if playback_mode is None:
         error_msg = f"Invalid mode: {mode}"
         request_logger.log_request(
             tool_name="play_playlist",
@@ -229,115 +387,116 @@ async def play_playlist(name: str, mode: str = "replace", shuffle: bool = False)
         return {"error_code": "invalid_mode", "message": error_msg, "retryable": False}
 
     try:
-        async with MopidyClient(config.mopidy.rpc_url, config.mopidy.timeout) as mopidy:
-            # Get all playlists
-            log.info("fetching_playlists")
-            playlists = await mopidy.get_playlists()
-
-            # Find matching playlists
-            name_lower = name.lower()
-            matches = []
-            for playlist in playlists:
-                if name_lower in playlist.get("name", "").lower():
-                    matches.append(playlist)
-
-            if not matches:
-                error_msg = f"No playlist found matching '{name}'"
-                latency_ms = int((time.time() - start_time) * 1000)
-                request_logger.log_request(
-                    tool_name="play_playlist",
-                    input_params=input_params,
-                    output={},
-                    status=RequestStatus.ERROR,
-                    total_latency_ms=latency_ms,
-                    error_message=error_msg,
-                    mopidy_search_results=0,
-                )
-                return {"error_code": "not_found", "message": error_msg, "retryable": False}
-
-            # Disambiguate if needed
-            llm_interaction = None
-            selected_playlist = matches[0]
-
-            if len(matches) > 1:
-                log.info("disambiguating_playlists", count=len(matches))
-                candidates = [mopidy.playlist_to_candidate(p) for p in matches]
-                disambiguator = DisambiguationService()
-                ranked, llm_interaction = await disambiguator.disambiguate(
-                    query=name, candidates=candidates, context={"search_type": "playlist"}, top_k=1
-                )
-                if ranked:
-                    # Find original playlist
-                    for playlist in matches:
-                        if playlist.get("uri") == ranked[0].mopidy_uri:
-                            selected_playlist = playlist
-                            break
-
-            # Get playlist details
-            log.info("loading_playlist", uri=selected_playlist.get("uri"))
-            playlist_details = await mopidy.get_playlist(selected_playlist["uri"])
-
-            if not playlist_details or not playlist_details.get("tracks"):
-                error_msg = f"Playlist '{selected_playlist.get('name')}' is empty"
-                latency_ms = int((time.time() - start_time) * 1000)
-                request_logger.log_request(
-                    tool_name="play_playlist",
-                    input_params=input_params,
-                    output={},
-                    status=RequestStatus.ERROR,
-                    total_latency_ms=latency_ms,
-                    error_message=error_msg,
-                    llm_interaction=llm_interaction,
-                    mopidy_search_results=len(matches),
-                )
-                return {"error_code": "empty_playlist", "message": error_msg, "retryable": False}
-
-            # Extract track URIs
-            tracks = playlist_details["tracks"]
-            track_uris = [track["uri"] for track in tracks]
-
-            log.info("queuing_playlist_tracks", count=len(track_uris))
-
-            # Queue tracks
-            if playback_mode == PlaybackMode.REPLACE:
-                await mopidy.clear_tracklist()
-
-            await mopidy.add_tracks(track_uris)
-
-            if shuffle:
-                await mopidy.shuffle_tracklist()
-
-            await mopidy.play()
-
-            # Get now playing
-            now_playing = await mopidy.get_now_playing()
-            if not now_playing:
-                now_playing = NowPlaying(
-                    title=tracks[0].get("name", "Unknown"),
-                    artist_or_show=tracks[0].get("artists", [{}])[0].get("name"),
-                    kind=MediaKind.TRACK,
-                )
-
-            # Build result
-            plan = PlayPlan(
-                playback_url=config.icecast.stream_url,
-                now_playing=now_playing,
-                total_tracks=len(track_uris),
+        mopidy = await get_mopidy()
+        # Get all playlists
+        log.info("fetching_playlists")
+        playlists = await mopidy.get_playlists()
+
+        # Find matching playlists
+        name_cf = name.casefold()
+        matches = []
+        for playlist in playlists:
+            if name_cf in playlist.get("name", "").casefold():
+                matches.append(playlist)
+
+        if not matches:
+            error_msg = f"No playlist found matching '{name}'"
+            latency_ms = int((time.time() - start_time) * 1000)
+            request_logger.log_request(
+                tool_name="play_playlist",
+                input_params=input_params,
+                output={},
+                status=RequestStatus.ERROR,
+                total_latency_ms=latency_ms,
+                error_message=error_msg,
+                mopidy_search_results=0,
             )
-
+            return {"error_code": "not_found", "message": error_msg, "retryable": False}
+
+        # Disambiguate if needed
+        llm_interaction = None
+        selected_playlist = matches[0]
+
+        if len(matches) > 1:
+            log.info("disambiguating_playlists", count=len(matches))
+            candidates = [mopidy.playlist_to_candidate(p) for p in matches]
+            disambiguator = DisambiguationService()
+            ranked, llm_interaction = await disambiguator.disambiguate(
+                query=name, candidates=candidates, context={"search_type": "playlist"}, top_k=1
+            )
+            if ranked:
+                # Find original playlist
+                for playlist in matches:
+                    if playlist.get("uri") == ranked[0].mopidy_uri:
+                        selected_playlist = playlist
+                        break
+
+        # Get playlist details
+        log.info("loading_playlist", uri=selected_playlist.get("uri"))
+        playlist_details = await mopidy.get_playlist(selected_playlist["uri"])
+
+        if not playlist_details or not playlist_details.get("tracks"):
+            error_msg = f"Playlist '{selected_playlist.get('name')}' is empty"
             latency_ms = int((time.time() - start_time) * 1000)
             request_logger.log_request(
                 tool_name="play_playlist",
                 input_params=input_params,
-                output=plan.model_dump(),
-                status=RequestStatus.SUCCESS,
+                output={},
+                status=RequestStatus.ERROR,
                 total_latency_ms=latency_ms,
+                error_message=error_msg,
                 llm_interaction=llm_interaction,
                 mopidy_search_results=len(matches),
             )
+            return {"error_code": "empty_playlist", "message": error_msg, "retryable": False}
 
-            log.info("playlist_playback_started", playlist=selected_playlist.get("name"))
-            return plan.model_dump()
+        # Extract track URIs
+        tracks = playlist_details["tracks"]
+        track_uris = [track["uri"] for track in tracks]
+
+        log.info("queuing_playlist_tracks", count=len(track_uris))
+
+        # Queue tracks
+        if playback_mode == PlaybackMode.REPLACE:
+            await mopidy.clear_tracklist()
+
+        if shuffle:
+            await _add_tracks_chunked(mopidy, track_uris)
+            await mopidy.shuffle_tracklist()
+            await mopidy.play()
+        else:
+            await _add_tracks_chunked(mopidy, track_uris, play_after_first=True)
+
+        # Get now playing
+        now_playing = await mopidy.get_now_playing()
+        if not now_playing:
+            now_playing = NowPlaying(
+                title=tracks[0].get("name", "Unknown"),
+                artist_or_show=_first_artist_name(tracks[0]),
+                kind=MediaKind.TRACK,
+            )
+
+        # Build result
+        plan = PlayPlan(
+            playback_url=config.icecast.stream_url,
+            now_playing=now_playing,
+            total_tracks=len(track_uris),
+        )
+
+        dumped = plan.model_dump()
+        latency_ms = int((time.time() - start_time) * 1000)
+        request_logger.log_request(
+            tool_name="play_playlist",
+            input_params=input_params,
+            output=dumped,
+            status=RequestStatus.SUCCESS,
+            total_latency_ms=latency_ms,
+            llm_interaction=llm_interaction,
+            mopidy_search_results=len(matches),
+        )
+
+        log.info("playlist_playback_started", playlist=selected_playlist.get("name"))
+        return dumped
 
     except MopidyError as e:
         latency_ms = int((time.time() - start_time) * 1000)
@@ -385,9 +544,8 @@ async def play_song_search(query: str, mode: str = "replace", limit: int = 10) -
     config = get_config()
     input_params = {"query": query, "mode": mode, "limit": limit}
 
-    try:
-        playback_mode = PlaybackMode(mode)
-    except ValueError:
+    playback_mode = _MODE_MAP.get(mode)
+    if playback_mode is None:
         error_msg = f"Invalid mode: {mode}"
         request_logger.log_request(
             tool_name="play_song_search",
@@ -400,111 +558,113 @@ async def play_song_search(query: str, mode: str = "replace", limit: int = 10) -
         return {"error_code": "invalid_mode", "message": error_msg, "retryable": False}
 
     try:
-        async with MopidyClient(config.mopidy.rpc_url, config.mopidy.timeout) as mopidy:
-            # Search for tracks
-            log.info("searching_tracks")
-            results = await mopidy.search(query={"any": [query]})
-
-            # Collect track candidates
-            track_candidates: list[MediaCandidate] = []
-            for backend_result in results:
-                for track in backend_result.get("tracks", []):
-                    candidate = mopidy.track_to_candidate(track)
-                    track_candidates.append(candidate)
-
-            if not track_candidates:
-                error_msg = f"No tracks found matching '{query}'"
-                latency_ms = int((time.time() - start_time) * 1000)
-                request_logger.log_request(
-                    tool_name="play_song_search",
-                    input_params=input_params,
-                    output={},
-                    status=RequestStatus.ERROR,
-                    total_latency_ms=latency_ms,
-                    error_message=error_msg,
-                    mopidy_search_results=0,
-                )
-                return {"error_code": "not_found", "message": error_msg, "retryable": False}
-
-            log.info("found_tracks", count=len(track_candidates))
-
-            # Disambiguate and rank tracks
-            llm_interaction = None
-            ranked_tracks = track_candidates[:limit]
-
-            if len(track_candidates) > 1:
-                log.info("disambiguating_tracks")
-                disambiguator = DisambiguationService()
-                ranked, llm_interaction = await disambiguator.disambiguate(
-                    query=query,
-                    candidates=track_candidates,
-                    context={"search_type": "track"},
-                    top_k=limit,
-                )
-                if ranked:
-                    ranked_tracks = ranked
-
-            # Get track URIs
-            track_uris = [t.mopidy_uri for t in ranked_tracks if t.mopidy_uri]
-
-            if not track_uris:
-                error_msg = "No playable tracks found"
-                latency_ms = int((time.time() - start_time) * 1000)
-                request_logger.log_request(
-                    tool_name="play_song_search",
-                    input_params=input_params,
-                    output={},
-                    status=RequestStatus.ERROR,
-                    total_latency_ms=latency_ms,
-                    error_message=error_msg,
-                    llm_interaction=llm_interaction,
-                    mopidy_search_results=len(track_candidates),
-                )
-                return {
-                    "error_code": "no_playable_tracks",
-                    "message": error_msg,
-                    "retryable": False,
-                }
-
-            log.info("queuing_tracks", count=len(track_uris))
-
-            # Queue tracks
-            if playback_mode == PlaybackMode.REPLACE:
-                await mopidy.clear_tracklist()
-
-            await mopidy.add_tracks(track_uris)
-            await mopidy.play()
-
-            # Get now playing
-            now_playing = await mopidy.get_now_playing()
-            if not now_playing:
-                first_track = ranked_tracks[0]
-                now_playing = NowPlaying(
-                    title=first_track.title,
-                    artist_or_show=first_track.subtitle,
-                    kind=MediaKind.TRACK,
-                )
+        mopidy = await get_mopidy()
+        # Search for tracks
+        log.info("searching_tracks")
+        results = await mopidy.search(query={"any": [query]})
+
+        # Collect track candidates
+        track_candidates = _dedupe_candidates(
+            [
+                mopidy.track_to_candidate(track)
+                for backend_result in results
+                for track in backend_result.get("tracks", [])
+            ]
+        )
 
-            # Build result
-            plan = PlayPlan(
-                playback_url=config.icecast.stream_url,
-                now_playing=now_playing,
-                total_tracks=len(track_uris),
+        if not track_candidates:
+            error_msg = f"No tracks found matching '{query}'"
+            latency_ms = int((time.time() - start_time) * 1000)
+            request_logger.log_request(
+                tool_name="play_song_search",
+                input_params=input_params,
+                output={},
+                status=RequestStatus.ERROR,
+                total_latency_ms=latency_ms,
+                error_message=error_msg,
+                mopidy_search_results=0,
             )
+            return {"error_code": "not_found", "message": error_msg, "retryable": False}
+
+        log.info("found_tracks", count=len(track_candidates))
+
+        # Disambiguate and rank tracks
+        llm_interaction = None
+        ranked_tracks = track_candidates[:limit]
+
+        if len(track_candidates) > 1:
+            log.info("disambiguating_tracks")
+            disambiguator = DisambiguationService()
+            ranked, llm_interaction = await disambiguator.disambiguate(
+                query=query,
+                candidates=_prefilter(query, track_candidates),
+                context={"search_type": "track"},
+                top_k=limit,
+            )
+            if ranked:
+                ranked_tracks = ranked
+
+        # Get track URIs
+        track_uris = [t.mopidy_uri for t in ranked_tracks if t.mopidy_uri]
 
+        if not track_uris:
+            error_msg = "No playable tracks found"
             latency_ms = int((time.time() - start_time) * 1000)
             request_logger.log_request(
                 tool_name="play_song_search",
                 input_params=input_params,
-                output=plan.model_dump(),
-                status=RequestStatus.SUCCESS,
+                output={},
+                status=RequestStatus.ERROR,
                 total_latency_ms=latency_ms,
+                error_message=error_msg,
                 llm_interaction=llm_interaction,
                 mopidy_search_results=len(track_candidates),
             )
+            return {
+                "error_code": "no_playable_tracks",
+                "message": error_msg,
+                "retryable": False,
+            }
+
+        log.info("queuing_tracks", count=len(track_uris))
+
+        # Queue tracks
+        if playback_mode == PlaybackMode.REPLACE:
+            await mopidy.clear_tracklist()
+
+        await _add_tracks_chunked(mopidy, track_uris, play_after_first=True)
+
+        # Get now playing
+        now_playing = await mopidy.get_now_playing()
+        if not now_playing:
+            first_track = ranked_tracks[0]
+            now_playing = NowPlaying(
+                title=first_track.title,
+                artist_or_show=first_track.subtitle,
+                kind=MediaKind.TRACK,
+            )
 
-            log.info("song_search_playback_started", query=query, tracks=len(track_uris))
-            return plan.model_dump()
+        # Build result
+        plan = PlayPlan(
+            playback_url=config.icecast.stream_url,
+            now_playing=now_playing,
+            total_tracks=len(track_uris),
+        )
+
+        dumped = plan.model_dump()
+        latency_ms = int((time.time() - start_time) * 1000)
+        request_logger.log_request(
+            tool_name="play_song_search",
+            input_params=input_params,
+            output=dumped,
+            status=RequestStatus.SUCCESS,
+            total_latency_ms=latency_ms,
+            llm_interaction=llm_interaction,
+            mopidy_search_results=len(track_candidates),
+        )
+
+        log.info("song_search_playback_started", query=query, tracks=len(track_uris))
+        return dumped
 
     except MopidyError as e:
         latency_ms = int((time.time() - start_time) * 1000)
@@ -555,9 +715,8 @@ async def play_music_by_genre(
     config = get_config()
     input_params = {"genre": genre, "mode": mode, "limit": limit, "shuffle": shuffle}
 
-    try:
-        playback_mode = PlaybackMode(mode)
-    except ValueError:
+    playback_mode = _MODE_MAP.get(mode)
+    if playback_mode is None:
         error_msg = f"Invalid mode: {mode}"
         request_logger.log_request(
             tool_name="play_music_by_genre",
@@ -570,92 +729,96 @@ async def play_music_by_genre(
         return {"error_code": "invalid_mode", "message": error_msg, "retryable": False}
 
     try:
-        async with MopidyClient(config.mopidy.rpc_url, config.mopidy.timeout) as mopidy:
-            caps = get_capabilities()
-
-            # Strategy 1: Try genre search if supported
-            if caps.supports_genre_search():
-                log.info("using_genre_search")
-                results = await mopidy.search(query={"genre": [genre]})
-
-                tracks = []
-                for backend_result in results:
-                    tracks.extend(backend_result.get("tracks", []))
-
-                if tracks:
-                    tracks = tracks[:limit]
-                    track_uris = [track["uri"] for track in tracks]
-
-                    log.info("found_tracks_by_genre", count=len(track_uris))
+        mopidy = await get_mopidy()
+        caps = get_capabilities()
+
+        # Strategy 1: Try genre search if supported
+        if caps.supports_genre_search():
+            log.info("using_genre_search")
+            results = await mopidy.search(query={"genre": [genre]})
+
+            tracks = list(
+                islice(
+                    chain.from_iterable(br.get("tracks", ()) for br in results),
+                    limit,
+                )
+            )
 
-                    if playback_mode == PlaybackMode.REPLACE:
-                        await mopidy.clear_tracklist()
+            if tracks:
+                track_uris = [track["uri"] for track in tracks]
 
-                    await mopidy.add_tracks(track_uris)
+                log.info("found_tracks_by_genre", count=len(track_uris))
 
-                    if shuffle:
-                        await mopidy.shuffle_tracklist()
+                if playback_mode == PlaybackMode.REPLACE:
+                    await mopidy.clear_tracklist()
 
+                if shuffle:
+                    await _add_tracks_chunked(mopidy, track_uris)
+                    await mopidy.shuffle_tracklist()
                     await mopidy.play()
-
-                    now_playing = await mopidy.get_now_playing()
-                    if not now_playing:
-                        now_playing = NowPlaying(
-                            title=tracks[0].get("name", "Unknown"),
-                            artist_or_show=tracks[0].get("artists", [{}])[0].get("name"),
-                            kind=MediaKind.TRACK,
-                        )
-
-                    plan = PlayPlan(
-                        playback_url=config.icecast.stream_url,
-                        now_playing=now_playing,
-                        total_tracks=len(track_uris),
-                    )
-
-                    latency_ms = int((time.time() - start_time) * 1000)
-                    request_logger.log_request(
-                        tool_name="play_music_by_genre",
-                        input_params=input_params,
-                        output=plan.model_dump(),
-                        status=RequestStatus.SUCCESS,
-                        total_latency_ms=latency_ms,
-                        mopidy_search_results=len(tracks),
+                else:
+                    await _add_tracks_chunked(mopidy, track_uris, play_after_first=True)
+
+                now_playing = await mopidy.get_now_playing()
+                if not now_playing:
+                    now_playing = NowPlaying(
+                        title=tracks[0].get("name", "Unknown"),
+                        artist_or_show=_first_artist_name(tracks[0]),
+                        kind=MediaKind.TRACK,
                     )
 
-                    log.info("genre_playback_started", genre=genre)
-                    return plan.model_dump()
-
-            # Strategy 2: Use genre playlist mapping
-            log.info("using_genre_playlist_mapping")
-            genre_mapping = None
-            for mapping in config.genre_mappings:
-                if mapping.genre.lower() == genre.lower():
-                    genre_mapping = mapping
-                    break
+                plan = PlayPlan(
+                    playback_url=config.icecast.stream_url,
+                    now_playing=now_playing,
+                    total_tracks=len(track_uris),
+                )
 
-            if not genre_mapping or not genre_mapping.playlists:
-                error_msg = f"Genre '{genre}' not supported. Configure genre mappings or use a different provider."
+                dumped = plan.model_dump()
                 latency_ms = int((time.time() - start_time) * 1000)
                 request_logger.log_request(
                     tool_name="play_music_by_genre",
                     input_params=input_params,
-                    output={},
-                    status=RequestStatus.ERROR,
+                    output=dumped,
+                    status=RequestStatus.SUCCESS,
                     total_latency_ms=latency_ms,
-                    error_message=error_msg,
+                    mopidy_search_results=len(tracks),
                 )
-                return {
-                    "error_code": "genre_not_configured",
-                    "message": error_msg,
-                    "retryable": False,
-                }
-
-            # Use the first mapped playlist
-            playlist_name = genre_mapping.playlists[0]
-            log.info("using_genre_playlist", playlist=playlist_name)
-
-            # Delegate to play_playlist
-            return await play_playlist(name=playlist_name, mode=mode, shuffle=shuffle)
+
+                log.info("genre_playback_started", genre=genre)
+                return dumped
+
+        # Strategy 2: Use genre playlist mapping
+        log.info("using_genre_playlist_mapping")
+        genre_cf = genre.casefold()
+        genre_mapping = None
+        for mapping in config.genre_mappings:
+            if mapping.genre.casefold() == genre_cf:
+                genre_mapping = mapping
+                break
+
+        if not genre_mapping or not genre_mapping.playlists:
+            error_msg = f"Genre '{genre}' not supported. Configure genre mappings or use a different provider."
+            latency_ms = int((time.time() - start_time) * 1000)
+            request_logger.log_request(
+                tool_name="play_music_by_genre",
+                input_params=input_params,
+                output={},
+                status=RequestStatus.ERROR,
+                total_latency_ms=latency_ms,
+                error_message=error_msg,
+            )
+            return {
+                "error_code": "genre_not_configured",
+                "message": error_msg,
+                "retryable": False,
+            }
+
+        # Use the first mapped playlist
+        playlist_name = genre_mapping.playlists[0]
+        log.info("using_genre_playlist", playlist=playlist_name)
+
+        # Delegate to play_playlist
+        return await play_playlist(name=playlist_name, mode=mode, shuffle=shuffle)
 
     except MopidyError as e:
         latency_ms = int((time.time() - start_time) * 1000)
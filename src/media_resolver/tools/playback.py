@@ -1,16 +1,42 @@
 """Playback control MCP tools."""
 
 import time
+from functools import lru_cache
 
 import structlog
 
 from media_resolver.config import get_config
 from media_resolver.models import StreamInfo
-from media_resolver.mopidy.client import MopidyClient, MopidyError
+from media_resolver.mopidy.client import MopidyError
+from media_resolver.mopidy.pool import get_mopidy
 from media_resolver.request_logger import RequestStatus, get_request_logger
+from media_resolver.tools.common import tool_handler
 
 logger = structlog.get_logger()
 
+# Pre-bound per-tool loggers; binding per call builds a new BoundLogger
+# each time, which adds up on the hot path.
+_LOG_STREAM = logger.bind(tool="get_stream_url")
+_LOG_NOW_PLAYING = logger.bind(tool="now_playing")
+
+# Shared empty dict for log_request params/output; treated as immutable
+_EMPTY: dict = {}
+
+# Static half of the stream error dict
+_STREAM_ERR = {"error_code": "stream_url_error", "retryable": False}
+
+
+@lru_cache(maxsize=1)
+def _stream_info_dict(url: str, mount: str) -> dict:
+    """
+    Serialize the stream info once per configured URL/mount.
+
+    The fields are static for a given config, so the pydantic validation
+    and model_dump walk only happen on the first call (or after a config
+    reload changes the values).
+    """
+    return StreamInfo(url=url, mount=mount, status="active").model_dump()
+
 
 async def get_stream_url() -> dict:
     """
@@ -19,47 +45,48 @@ async def get_stream_url() -> dict:
     Returns:
         Dict with stream URL information
     """
-    start_time = time.time()
-    log = logger.bind(tool="get_stream_url")
     request_logger = get_request_logger()
+    log = _LOG_STREAM
+    start_ns = time.perf_counter_ns() if request_logger.enabled else 0
 
     config = get_config()
 
     try:
         # Return the configured Icecast URL
-        result = StreamInfo(
-            url=config.icecast.stream_url, mount=config.icecast.mount, status="active"
-        )
+        dumped = _stream_info_dict(config.icecast.stream_url, config.icecast.mount)
 
-        latency_ms = int((time.time() - start_time) * 1000)
+        if request_logger.enabled:
+            latency_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
-        request_logger.log_request(
-            tool_name="get_stream_url",
-            input_params={},
-            output=result.model_dump(),
-            status=RequestStatus.SUCCESS,
-            total_latency_ms=latency_ms,
-        )
+            request_logger.log_request(
+                tool_name="get_stream_url",
+                input_params=_EMPTY,
+                output=dumped,
+                status=RequestStatus.SUCCESS,
+                total_latency_ms=latency_ms,
+            )
 
-        log.info("stream_url_returned", url=result.url)
-        return result.model_dump()
+        log.info("stream_url_returned", url=dumped["url"])
+        return dumped
 
     except Exception as e:
-        latency_ms = int((time.time() - start_time) * 1000)
         log.error("get_stream_url_failed", error=str(e))
 
-        request_logger.log_request(
-            tool_name="get_stream_url",
-            input_params={},
-            output={},
-            status=RequestStatus.ERROR,
-            total_latency_ms=latency_ms,
-            error_message=str(e),
-        )
+        if request_logger.enabled:
+            latency_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+            request_logger.log_request(
+                tool_name="get_stream_url",
+                input_params=_EMPTY,
+                output=_EMPTY,
+                status=RequestStatus.ERROR,
+                total_latency_ms=latency_ms,
+                error_message=str(e),
+            )
 
-        return {"error_code": "stream_url_error", "message": str(e), "retryable": False}
+        return {**_STREAM_ERR, "message": str(e)}
 
 
+@tool_handler("now_playing", error_map={MopidyError: ("mopidy_error", True)})
 async def now_playing() -> dict:
     """
     Get information about currently playing media.
@@ -67,66 +94,20 @@ async def now_playing() -> dict:
     Returns:
         Dict with now playing information
     """
-    start_time = time.time()
-    log = logger.bind(tool="now_playing")
-    request_logger = get_request_logger()
-
-    config = get_config()
-
-    try:
-        async with MopidyClient(config.mopidy.rpc_url, config.mopidy.timeout) as mopidy:
-            now_playing_info = await mopidy.get_now_playing()
-
-            if not now_playing_info:
-                result = {
-                    "playing": False,
-                    "message": "Nothing is currently playing",
-                }
-            else:
-                result = {"playing": True, **now_playing_info.model_dump()}
+    log = _LOG_NOW_PLAYING
 
-            latency_ms = int((time.time() - start_time) * 1000)
+    mopidy = await get_mopidy()
+    now_playing_info = await mopidy.get_now_playing()
 
-            request_logger.log_request(
-                tool_name="now_playing",
-                input_params={},
-                output=result,
-                status=RequestStatus.SUCCESS,
-                total_latency_ms=latency_ms,
-            )
-
-            log.info("now_playing_returned", playing=result.get("playing"))
-            return result
-
-    except MopidyError as e:
-        latency_ms = int((time.time() - start_time) * 1000)
-        log.error("now_playing_failed", error=str(e))
-
-        request_logger.log_request(
-            tool_name="now_playing",
-            input_params={},
-            output={},
-            status=RequestStatus.ERROR,
-            total_latency_ms=latency_ms,
-            error_message=str(e),
-        )
-
-        return {
-            "error_code": "mopidy_error",
-            "message": f"Failed to get playback status: {e}",
-            "retryable": True,
+    if not now_playing_info:
+        result = {
+            "playing": False,
+            "message": "Nothing is currently playing",
         }
-    except Exception as e:
-        latency_ms = int((time.time() - start_time) * 1000)
-        log.error("now_playing_unexpected_error", error=str(e))
-
-        request_logger.log_request(
-            tool_name="now_playing",
-            input_params={},
-            output={},
-            status=RequestStatus.ERROR,
-            total_latency_ms=latency_ms,
-            error_message=str(e),
-        )
-
-        return {"error_code": "unexpected_error", "message": str(e), "retryable": False}
+    else:
+        # NowPlaying is flat and trusted, so plain field iteration beats
+        # model_dump's serializer walk on this polled path
+        result = {"playing": True, **dict(now_playing_info)}
+
+    log.info("now_playing_returned", playing=result.get("playing"))
+    return result
@@ -5,15 +5,62 @@ import time
 import structlog
 
 from media_resolver.config import get_config
-from media_resolver.disambiguation.service import DisambiguationService
+from media_resolver.disambiguation.service import get_disambiguation_service
 from media_resolver.models import MediaKind, NowPlaying, PlaybackMode, PlayPlan
 from media_resolver.mopidy.client import MopidyClient, MopidyError
-from media_resolver.podcast.resolver import PodcastResolver, PodcastResolverError
+from media_resolver.mopidy.pool import get_mopidy
+from media_resolver.podcast.resolver import PodcastResolverError, get_resolver
 from media_resolver.request_logger import RequestStatus, get_request_logger
+from media_resolver.tools.common import _MODE_MAP, tool_handler
 
 logger = structlog.get_logger()
 
+# Pre-bound per-tool loggers; per-call fields are bound on top of these.
+_LOG_LATEST = logger.bind(tool="play_podcast_latest")
+_LOG_RANDOM = logger.bind(tool="play_podcast_random")
+_LOG_SEARCH = logger.bind(tool="search_podcast")
+_LOG_EPISODE = logger.bind(tool="play_podcast_episode")
+_LOG_GENRE = logger.bind(tool="play_podcast_by_genre")
+
+# Static halves of the error dicts returned by validation paths
+_INVALID_MODE_ERR = {"error_code": "invalid_mode", "retryable": False}
+_GENRE_NOT_FOUND_ERR = {"error_code": "genre_not_found", "retryable": False}
+_PODCAST_ERR = {"error_code": "podcast_error", "retryable": False}
+_UNEXPECTED_ERR = {"error_code": "unexpected_error", "retryable": False}
+
+# Shared exception -> (error_code, retryable) mapping for the tool_handler
+_ERROR_MAP = {
+    PodcastResolverError: ("podcast_error", False),
+    MopidyError: ("mopidy_error", True),
+}
+
+
+async def _queue_episode(
+    mopidy: MopidyClient, audio_url: str | None, playback_mode: PlaybackMode
+) -> None:
+    """
+    Queue an episode's audio URL and start playback in one batched RPC.
+
+    Collapses the clear/add/play sequence into a single JSON-RPC batch
+    request, saving two Mopidy round trips per playback call. The clear
+    is only included for REPLACE mode.
+
+    Args:
+        mopidy: Connected Mopidy client
+        audio_url: Episode audio URL, if any
+        playback_mode: How to add the episode to the queue
+    """
+    calls: list[tuple[str, dict]] = []
+    if playback_mode == PlaybackMode.REPLACE:
+        calls.append(("core.tracklist.clear", {}))
+    if audio_url:
+        calls.append(("core.tracklist.add", {"uris": [audio_url]}))
+        calls.append(("core.playback.play", {}))
+    if calls:
+        await mopidy.batch(calls)
+
 
+@tool_handler("play_podcast_latest", error_map=_ERROR_MAP)
 async def play_podcast_latest(show: str, mode: str = "replace") -> dict:
     """
     Play the latest episode of a podcast show.
@@ -25,107 +72,40 @@ async def play_podcast_latest(show: str, mode: str = "replace") -> dict:
     Returns:
         PlayPlan dict or error
     """
-    start_time = time.time()
-    log = logger.bind(tool="play_podcast_latest", show=show)
-    request_logger = get_request_logger()
-
+    log = _LOG_LATEST.bind(show=show)
     config = get_config()
-    input_params = {"show": show, "mode": mode}
 
-    try:
-        playback_mode = PlaybackMode(mode)
-    except ValueError:
-        error_msg = f"Invalid mode: {mode}"
-        request_logger.log_request(
-            tool_name="play_podcast_latest",
-            input_params=input_params,
-            output={},
-            status=RequestStatus.ERROR,
-            total_latency_ms=int((time.time() - start_time) * 1000),
-            error_message=error_msg,
-        )
-        return {"error_code": "invalid_mode", "message": error_msg, "retryable": False}
+    playback_mode = _MODE_MAP.get(mode)
+    if playback_mode is None:
+        return {**_INVALID_MODE_ERR, "message": f"Invalid mode: {mode}"}
 
-    try:
-        resolver = PodcastResolver(config)
-        episode = await resolver.get_latest_episode(show)
-
-        log.info("got_latest_episode", title=episode.title)
-
-        # Play via Mopidy if it has URI, otherwise note this is for direct play
-        async with MopidyClient(config.mopidy.rpc_url, config.mopidy.timeout) as mopidy:
-            if playback_mode == PlaybackMode.REPLACE:
-                await mopidy.clear_tracklist()
-
-            # Try to add audio URL to Mopidy (works if Mopidy supports HTTP streams)
-            if episode.audio_url:
-                await mopidy.add_tracks([episode.audio_url])
-                await mopidy.play()
-
-            # Build result
-            now_playing = NowPlaying(
-                title=episode.title,
-                artist_or_show=episode.subtitle,
-                kind=MediaKind.PODCAST_EPISODE,
-                duration_sec=episode.duration_sec,
-            )
+    resolver = get_resolver()
+    episode = await resolver.get_latest_episode(show)
 
-            plan = PlayPlan(
-                playback_url=config.icecast.stream_url, now_playing=now_playing, total_tracks=1
-            )
+    log.info("got_latest_episode", title=episode.title)
 
-            latency_ms = int((time.time() - start_time) * 1000)
-            request_logger.log_request(
-                tool_name="play_podcast_latest",
-                input_params=input_params,
-                output=plan.model_dump(),
-                status=RequestStatus.SUCCESS,
-                total_latency_ms=latency_ms,
-            )
+    # Play via Mopidy if it has URI, otherwise note this is for direct play
+    mopidy = await get_mopidy()
+    # Try to add audio URL to Mopidy (works if Mopidy supports HTTP streams)
+    await _queue_episode(mopidy, episode.audio_url, playback_mode)
 
-            log.info("podcast_latest_started", show=show, episode=episode.title)
-            return plan.model_dump()
+    # Build result
+    now_playing = NowPlaying.model_construct(
+        title=episode.title,
+        artist_or_show=episode.subtitle,
+        kind=MediaKind.PODCAST_EPISODE,
+        duration_sec=episode.duration_sec,
+    )
 
-    except PodcastResolverError as e:
-        latency_ms = int((time.time() - start_time) * 1000)
-        log.error("podcast_resolver_error", error=str(e))
-        request_logger.log_request(
-            tool_name="play_podcast_latest",
-            input_params=input_params,
-            output={},
-            status=RequestStatus.ERROR,
-            total_latency_ms=latency_ms,
-            error_message=str(e),
-        )
-        return {"error_code": "podcast_error", "message": str(e), "retryable": False}
-
-    except MopidyError as e:
-        latency_ms = int((time.time() - start_time) * 1000)
-        log.error("mopidy_error", error=str(e))
-        request_logger.log_request(
-            tool_name="play_podcast_latest",
-            input_params=input_params,
-            output={},
-            status=RequestStatus.ERROR,
-            total_latency_ms=latency_ms,
-            error_message=str(e),
-        )
-        return {"error_code": "mopidy_error", "message": str(e), "retryable": True}
+    plan = PlayPlan.model_construct(
+        playback_url=config.icecast.stream_url, now_playing=now_playing, total_tracks=1
+    )
 
-    except Exception as e:
-        latency_ms = int((time.time() - start_time) * 1000)
-        log.error("unexpected_error", error=str(e))
-        request_logger.log_request(
-            tool_name="play_podcast_latest",
-            input_params=input_params,
-            output={},
-            status=RequestStatus.ERROR,
-            total_latency_ms=latency_ms,
-            error_message=str(e),
-        )
-        return {"error_code": "unexpected_error", "message": str(e), "retryable": False}
+    log.info("podcast_latest_started", show=show, episode=episode.title)
+    return plan.model_dump()
 
 
+@tool_handler("play_podcast_random", error_map=_ERROR_MAP)
 async def play_podcast_random(show: str, mode: str = "replace", recent_count: int = 50) -> dict:
     """
     Play a random episode from a podcast show.
@@ -138,102 +118,34 @@ async def play_podcast_random(show: str, mode: str = "replace", recent_count: in
     Returns:
         PlayPlan dict or error
     """
-    start_time = time.time()
-    log = logger.bind(tool="play_podcast_random", show=show)
-    request_logger = get_request_logger()
-
+    log = _LOG_RANDOM.bind(show=show)
     config = get_config()
-    input_params = {"show": show, "mode": mode, "recent_count": recent_count}
 
-    try:
-        playback_mode = PlaybackMode(mode)
-    except ValueError:
-        error_msg = f"Invalid mode: {mode}"
-        request_logger.log_request(
-            tool_name="play_podcast_random",
-            input_params=input_params,
-            output={},
-            status=RequestStatus.ERROR,
-            total_latency_ms=int((time.time() - start_time) * 1000),
-            error_message=error_msg,
-        )
-        return {"error_code": "invalid_mode", "message": error_msg, "retryable": False}
+    playback_mode = _MODE_MAP.get(mode)
+    if playback_mode is None:
+        return {**_INVALID_MODE_ERR, "message": f"Invalid mode: {mode}"}
 
-    try:
-        resolver = PodcastResolver(config)
-        episode = await resolver.get_random_episode(show, recent_count)
+    resolver = get_resolver()
+    episode = await resolver.get_random_episode(show, recent_count)
 
-        log.info("got_random_episode", title=episode.title)
+    log.info("got_random_episode", title=episode.title)
 
-        async with MopidyClient(config.mopidy.rpc_url, config.mopidy.timeout) as mopidy:
-            if playback_mode == PlaybackMode.REPLACE:
-                await mopidy.clear_tracklist()
+    mopidy = await get_mopidy()
+    await _queue_episode(mopidy, episode.audio_url, playback_mode)
 
-            if episode.audio_url:
-                await mopidy.add_tracks([episode.audio_url])
-                await mopidy.play()
+    now_playing = NowPlaying.model_construct(
+        title=episode.title,
+        artist_or_show=episode.subtitle,
+        kind=MediaKind.PODCAST_EPISODE,
+        duration_sec=episode.duration_sec,
+    )
 
-            now_playing = NowPlaying(
-                title=episode.title,
-                artist_or_show=episode.subtitle,
-                kind=MediaKind.PODCAST_EPISODE,
-                duration_sec=episode.duration_sec,
-            )
-
-            plan = PlayPlan(
-                playback_url=config.icecast.stream_url, now_playing=now_playing, total_tracks=1
-            )
+    plan = PlayPlan.model_construct(
+        playback_url=config.icecast.stream_url, now_playing=now_playing, total_tracks=1
+    )
 
-            latency_ms = int((time.time() - start_time) * 1000)
-            request_logger.log_request(
-                tool_name="play_podcast_random",
-                input_params=input_params,
-                output=plan.model_dump(),
-                status=RequestStatus.SUCCESS,
-                total_latency_ms=latency_ms,
-            )
-
-            log.info("podcast_random_started", show=show, episode=episode.title)
-            return plan.model_dump()
-
-    except PodcastResolverError as e:
-        latency_ms = int((time.time() - start_time) * 1000)
-        log.error("podcast_resolver_error", error=str(e))
-        request_logger.log_request(
-            tool_name="play_podcast_random",
-            input_params=input_params,
-            output={},
-            status=RequestStatus.ERROR,
-            total_latency_ms=latency_ms,
-            error_message=str(e),
-        )
-        return {"error_code": "podcast_error", "message": str(e), "retryable": False}
-
-    except MopidyError as e:
-        latency_ms = int((time.time() - start_time) * 1000)
-        log.error("mopidy_error", error=str(e))
-        request_logger.log_request(
-            tool_name="play_podcast_random",
-            input_params=input_params,
-            output={},
-            status=RequestStatus.ERROR,
-            total_latency_ms=latency_ms,
-            error_message=str(e),
-        )
-        return {"error_code": "mopidy_error", "message": str(e), "retryable": True}
-
-    except Exception as e:
-        latency_ms = int((time.time() - start_time) * 1000)
-        log.error("unexpected_error", error=str(e))
-        request_logger.log_request(
-            tool_name="play_podcast_random",
-            input_params=input_params,
-            output={},
-            status=RequestStatus.ERROR,
-            total_latency_ms=latency_ms,
-            error_message=str(e),
-        )
-        return {"error_code": "unexpected_error", "message": str(e), "retryable": False}
+    log.info("podcast_random_started", show=show, episode=episode.title)
+    return plan.model_dump()
 
 
 async def search_podcast(show: str, query: str, limit: int = 5) -> dict:
@@ -248,23 +160,23 @@ async def search_podcast(show: str, query: str, limit: int = 5) -> dict:
     Returns:
         Dict with candidates list
     """
-    start_time = time.time()
-    log = logger.bind(tool="search_podcast", show=show, query=query)
     request_logger = get_request_logger()
+    log = _LOG_SEARCH.bind(show=show, query=query)
+    start_ns = time.perf_counter_ns() if request_logger.enabled else 0
 
-    config = get_config()
     input_params = {"show": show, "query": query, "limit": limit}
 
     try:
-        resolver = PodcastResolver(config)
+        resolver = get_resolver()
         candidates = await resolver.search_episodes(show, query, limit)
 
         log.info("found_episodes", count=len(candidates))
 
-        # Use LLM to rank if we have multiple candidates
+        # Use LLM to rank if there is a real choice to make; with limit<=1
+        # the resolver's own ordering already picks the top result
         llm_interaction = None
-        if len(candidates) > 1:
-            disambiguator = DisambiguationService()
+        if len(candidates) > 1 and limit > 1:
+            disambiguator = get_disambiguation_service()
             ranked, llm_interaction = await disambiguator.disambiguate(
                 query=query,
                 candidates=candidates,
@@ -276,45 +188,49 @@ async def search_podcast(show: str, query: str, limit: int = 5) -> dict:
 
         result = {"candidates": [c.model_dump() for c in candidates]}
 
-        latency_ms = int((time.time() - start_time) * 1000)
-        request_logger.log_request(
-            tool_name="search_podcast",
-            input_params=input_params,
-            output=result,
-            status=RequestStatus.SUCCESS,
-            total_latency_ms=latency_ms,
-            llm_interaction=llm_interaction,
-        )
+        if request_logger.enabled:
+            latency_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+            request_logger.log_request(
+                tool_name="search_podcast",
+                input_params=input_params,
+                output=result,
+                status=RequestStatus.SUCCESS,
+                total_latency_ms=latency_ms,
+                llm_interaction=llm_interaction,
+            )
 
         return result
 
     except PodcastResolverError as e:
-        latency_ms = int((time.time() - start_time) * 1000)
         log.error("podcast_resolver_error", error=str(e))
-        request_logger.log_request(
-            tool_name="search_podcast",
-            input_params=input_params,
-            output={},
-            status=RequestStatus.ERROR,
-            total_latency_ms=latency_ms,
-            error_message=str(e),
-        )
-        return {"error_code": "podcast_error", "message": str(e), "retryable": False}
+        if request_logger.enabled:
+            latency_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+            request_logger.log_request(
+                tool_name="search_podcast",
+                input_params=input_params,
+                output={},
+                status=RequestStatus.ERROR,
+                total_latency_ms=latency_ms,
+                error_message=str(e),
+            )
+        return {**_PODCAST_ERR, "message": str(e)}
 
     except Exception as e:
-        latency_ms = int((time.time() - start_time) * 1000)
         log.error("unexpected_error", error=str(e))
-        request_logger.log_request(
-            tool_name="search_podcast",
-            input_params=input_params,
-            output={},
-            status=RequestStatus.ERROR,
-            total_latency_ms=latency_ms,
-            error_message=str(e),
-        )
-        return {"error_code": "unexpected_error", "message": str(e), "retryable": False}
+        if request_logger.enabled:
+            latency_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+            request_logger.log_request(
+                tool_name="search_podcast",
+                input_params=input_params,
+                output={},
+                status=RequestStatus.ERROR,
+                total_latency_ms=latency_ms,
+                error_message=str(e),
+            )
+        return {**_UNEXPECTED_ERR, "message": str(e)}
 
 
+@tool_handler("play_podcast_episode", error_map=_ERROR_MAP)
 async def play_podcast_episode(id: str, mode: str = "replace") -> dict:
     """
     Play a specific podcast episode by ID.
@@ -326,92 +242,39 @@ async def play_podcast_episode(id: str, mode: str = "replace") -> dict:
     Returns:
         PlayPlan dict or error
     """
-    start_time = time.time()
-    log = logger.bind(tool="play_podcast_episode", id=id)
-    request_logger = get_request_logger()
-
+    log = _LOG_EPISODE.bind(id=id)
     config = get_config()
-    input_params = {"id": id, "mode": mode}
 
-    try:
-        playback_mode = PlaybackMode(mode)
-    except ValueError:
-        error_msg = f"Invalid mode: {mode}"
-        request_logger.log_request(
-            tool_name="play_podcast_episode",
-            input_params=input_params,
-            output={},
-            status=RequestStatus.ERROR,
-            total_latency_ms=int((time.time() - start_time) * 1000),
-            error_message=error_msg,
-        )
-        return {"error_code": "invalid_mode", "message": error_msg, "retryable": False}
+    playback_mode = _MODE_MAP.get(mode)
+    if playback_mode is None:
+        return {**_INVALID_MODE_ERR, "message": f"Invalid mode: {mode}"}
 
-    try:
-        # ID should be a URL or URI we can play
-        audio_url = id
+    # ID should be a URL or URI we can play
+    audio_url = id
 
-        log.info("playing_episode_by_id")
+    log.info("playing_episode_by_id")
 
-        async with MopidyClient(config.mopidy.rpc_url, config.mopidy.timeout) as mopidy:
-            if playback_mode == PlaybackMode.REPLACE:
-                await mopidy.clear_tracklist()
+    mopidy = await get_mopidy()
+    await _queue_episode(mopidy, audio_url, playback_mode)
 
-            await mopidy.add_tracks([audio_url])
-            await mopidy.play()
-
-            # Get now playing
-            now_playing = await mopidy.get_now_playing()
-            if not now_playing:
-                now_playing = NowPlaying(
-                    title="Podcast Episode",
-                    artist_or_show="Unknown",
-                    kind=MediaKind.PODCAST_EPISODE,
-                )
-
-            plan = PlayPlan(
-                playback_url=config.icecast.stream_url, now_playing=now_playing, total_tracks=1
-            )
-
-            latency_ms = int((time.time() - start_time) * 1000)
-            request_logger.log_request(
-                tool_name="play_podcast_episode",
-                input_params=input_params,
-                output=plan.model_dump(),
-                status=RequestStatus.SUCCESS,
-                total_latency_ms=latency_ms,
-            )
-
-            log.info("podcast_episode_started")
-            return plan.model_dump()
-
-    except MopidyError as e:
-        latency_ms = int((time.time() - start_time) * 1000)
-        log.error("mopidy_error", error=str(e))
-        request_logger.log_request(
-            tool_name="play_podcast_episode",
-            input_params=input_params,
-            output={},
-            status=RequestStatus.ERROR,
-            total_latency_ms=latency_ms,
-            error_message=str(e),
+    # Get now playing
+    now_playing = await mopidy.get_now_playing()
+    if not now_playing:
+        now_playing = NowPlaying.model_construct(
+            title="Podcast Episode",
+            artist_or_show="Unknown",
+            kind=MediaKind.PODCAST_EPISODE,
         )
-        return {"error_code": "mopidy_error", "message": str(e), "retryable": True}
 
-    except Exception as e:
-        latency_ms = int((time.time() - start_time) * 1000)
-        log.error("unexpected_error", error=str(e))
-        request_logger.log_request(
-            tool_name="play_podcast_episode",
-            input_params=input_params,
-            output={},
-            status=RequestStatus.ERROR,
-            total_latency_ms=latency_ms,
-            error_message=str(e),
-        )
-        return {"error_code": "unexpected_error", "message": str(e), "retryable": False}
+    plan = PlayPlan.model_construct(
+        playback_url=config.icecast.stream_url, now_playing=now_playing, total_tracks=1
+    )
+
+    log.info("podcast_episode_started")
+    return plan.model_dump()
 
 
+@tool_handler("play_podcast_by_genre", error_map=_ERROR_MAP)
 async def play_podcast_by_genre(genre: str, mode: str = "replace") -> dict:
     """
     Play latest episode from a podcast in the specified genre.
@@ -423,112 +286,37 @@ async def play_podcast_by_genre(genre: str, mode: str = "replace") -> dict:
     Returns:
         PlayPlan dict or error
     """
-    start_time = time.time()
-    log = logger.bind(tool="play_podcast_by_genre", genre=genre)
-    request_logger = get_request_logger()
-
+    log = _LOG_GENRE.bind(genre=genre)
     config = get_config()
-    input_params = {"genre": genre, "mode": mode}
 
-    try:
-        playback_mode = PlaybackMode(mode)
-    except ValueError:
-        error_msg = f"Invalid mode: {mode}"
-        request_logger.log_request(
-            tool_name="play_podcast_by_genre",
-            input_params=input_params,
-            output={},
-            status=RequestStatus.ERROR,
-            total_latency_ms=int((time.time() - start_time) * 1000),
-            error_message=error_msg,
-        )
-        return {"error_code": "invalid_mode", "message": error_msg, "retryable": False}
+    playback_mode = _MODE_MAP.get(mode)
+    if playback_mode is None:
+        return {**_INVALID_MODE_ERR, "message": f"Invalid mode: {mode}"}
 
-    try:
-        resolver = PodcastResolver(config)
-        episode = await resolver.get_latest_from_genre(genre)
+    resolver = get_resolver()
+    episode = await resolver.get_latest_from_genre(genre)
 
-        if not episode:
-            error_msg = f"No podcasts found for genre '{genre}'. Check configuration."
-            latency_ms = int((time.time() - start_time) * 1000)
-            request_logger.log_request(
-                tool_name="play_podcast_by_genre",
-                input_params=input_params,
-                output={},
-                status=RequestStatus.ERROR,
-                total_latency_ms=latency_ms,
-                error_message=error_msg,
-            )
-            return {"error_code": "genre_not_found", "message": error_msg, "retryable": False}
+    if not episode:
+        return {
+            **_GENRE_NOT_FOUND_ERR,
+            "message": f"No podcasts found for genre '{genre}'. Check configuration.",
+        }
 
-        log.info("got_genre_episode", title=episode.title, show=episode.subtitle)
+    log.info("got_genre_episode", title=episode.title, show=episode.subtitle)
 
-        async with MopidyClient(config.mopidy.rpc_url, config.mopidy.timeout) as mopidy:
-            if playback_mode == PlaybackMode.REPLACE:
-                await mopidy.clear_tracklist()
+    mopidy = await get_mopidy()
+    await _queue_episode(mopidy, episode.audio_url, playback_mode)
 
-            if episode.audio_url:
-                await mopidy.add_tracks([episode.audio_url])
-                await mopidy.play()
+    now_playing = NowPlaying.model_construct(
+        title=episode.title,
+        artist_or_show=episode.subtitle,
+        kind=MediaKind.PODCAST_EPISODE,
+        duration_sec=episode.duration_sec,
+    )
 
-            now_playing = NowPlaying(
-                title=episode.title,
-                artist_or_show=episode.subtitle,
-                kind=MediaKind.PODCAST_EPISODE,
-                duration_sec=episode.duration_sec,
-            )
+    plan = PlayPlan.model_construct(
+        playback_url=config.icecast.stream_url, now_playing=now_playing, total_tracks=1
+    )
 
-            plan = PlayPlan(
-                playback_url=config.icecast.stream_url, now_playing=now_playing, total_tracks=1
-            )
-
-            latency_ms = int((time.time() - start_time) * 1000)
-            request_logger.log_request(
-                tool_name="play_podcast_by_genre",
-                input_params=input_params,
-                output=plan.model_dump(),
-                status=RequestStatus.SUCCESS,
-                total_latency_ms=latency_ms,
-            )
-
-            log.info("podcast_genre_started", genre=genre, episode=episode.title)
-            return plan.model_dump()
-
-    except PodcastResolverError as e:
-        latency_ms = int((time.time() - start_time) * 1000)
-        log.error("podcast_resolver_error", error=str(e))
-        request_logger.log_request(
-            tool_name="play_podcast_by_genre",
-            input_params=input_params,
-            output={},
-            status=RequestStatus.ERROR,
-            total_latency_ms=latency_ms,
-            error_message=str(e),
-        )
-        return {"error_code": "podcast_error", "message": str(e), "retryable": False}
-
-    except MopidyError as e:
-        latency_ms = int((time.time() - start_time) * 1000)
-        log.error("mopidy_error", error=str(e))
-        request_logger.log_request(
-            tool_name="play_podcast_by_genre",
-            input_params=input_params,
-            output={},
-            status=RequestStatus.ERROR,
-            total_latency_ms=latency_ms,
-            error_message=str(e),
-        )
-        return {"error_code": "mopidy_error", "message": str(e), "retryable": True}
-
-    except Exception as e:
-        latency_ms = int((time.time() - start_time) * 1000)
-        log.error("unexpected_error", error=str(e))
-        request_logger.log_request(
-            tool_name="play_podcast_by_genre",
-            input_params=input_params,
-            output={},
-            status=RequestStatus.ERROR,
-            total_latency_ms=latency_ms,
-            error_message=str(e),
-        )
-        return {"error_code": "unexpected_error", "message": str(e), "retryable": False}
+    log.info("podcast_genre_started", genre=genre, episode=episode.title)
+    return plan.model_dump()
@@ -0,0 +1,47 @@
+"""Optional OpenTelemetry tracing support.
+
+Spans are only emitted when tracing is enabled in configuration AND the
+opentelemetry-api package is installed (the 'tracing' extra). In all other
+cases a no-op tracer is returned so instrumented code paths carry no
+measurable overhead.
+"""
+
+from contextlib import contextmanager
+from typing import Any
+
+from media_resolver.config import get_config
+
+try:
+    from opentelemetry import trace as _otel_trace
+
+    _OTEL_AVAILABLE = True
+except ImportError:
+    _otel_trace = None
+    _OTEL_AVAILABLE = False
+
+
+class _NoOpTracer:
+    """Tracer stand-in used when tracing is disabled or otel is missing."""
+
+    @contextmanager
+    def start_as_current_span(self, name: str, attributes: dict[str, Any] | None = None):
+        yield None
+
+
+_NOOP_TRACER = _NoOpTracer()
+
+
+def get_tracer(name: str):
+    """
+    Get a tracer for the given instrumentation name.
+
+    Args:
+        name: Instrumentation module name (usually __name__)
+
+    Returns:
+        An OpenTelemetry tracer when tracing is enabled and available,
+        otherwise a no-op tracer
+    """
+    if _OTEL_AVAILABLE and get_config().server.tracing_enabled:
+        return _otel_trace.get_tracer(name)
+    return _NOOP_TRACER
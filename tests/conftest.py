@@ -1,10 +1,65 @@
 """Shared test fixtures and configuration."""
 
+import json
 from unittest.mock import AsyncMock
 
+import httpx
 import pytest
 
 from media_resolver.config import Config, IcecastConfig, LLMBackend, LLMConfig, MopidyConfig
+from media_resolver.disambiguation.service import DisambiguationService
+from media_resolver.podcast.rss_parser import PodcastRSSParser
+
+
+class StubResponse:
+    """Minimal httpx.Response stand-in carrying a serialized RPC payload."""
+
+    def __init__(self, data):
+        self.content = json.dumps(data).encode()
+
+    def raise_for_status(self):
+        return None
+
+
+@pytest.fixture
+def make_response():
+    """Build a lightweight response stub from an RPC payload dict or list."""
+    return StubResponse
+
+
+class FakeHttpClient:
+    """Minimal async HTTP client stub that records post() calls."""
+
+    def __init__(self, response):
+        self._response = response
+        self.calls = []
+
+    async def post(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return self._response
+
+    @property
+    def last(self):
+        """Arguments of the most recent post() call as (args, kwargs)."""
+        return self.calls[-1]
+
+
+@pytest.fixture
+def make_http():
+    """Build a recording HTTP client stub around a canned response."""
+    return FakeHttpClient
+
+
+@pytest.fixture(scope="session")
+def default_config():
+    """A default Config, shared read-only across the session."""
+    return Config()
+
+
+@pytest.fixture
+def disambiguation_service():
+    """Disambiguation service with a stub LLM, for tests that never invoke it."""
+    return DisambiguationService(llm=AsyncMock())
 
 
 @pytest.fixture
@@ -83,6 +138,18 @@ def mock_httpx_client():
     return client
 
 
+@pytest.fixture
+def rss_transport(sample_rss_feed):
+    """MockTransport answering every request with the sample feed."""
+    return httpx.MockTransport(lambda request: httpx.Response(200, text=sample_rss_feed))
+
+
+@pytest.fixture
+def rss_parser(rss_transport):
+    """RSS parser backed by the sample-feed transport."""
+    return PodcastRSSParser(client=httpx.AsyncClient(transport=rss_transport))
+
+
 @pytest.fixture
 def sample_rss_feed():
     """Sample RSS feed content."""
@@ -6,9 +6,9 @@ from fastapi.testclient import TestClient
 from media_resolver.server import create_app
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
-    """Create test client."""
+    """Create test client, shared across tests since the app is read-only here."""
     app = create_app()
     return TestClient(app)
 
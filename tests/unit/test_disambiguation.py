@@ -1,13 +1,33 @@
 """Unit tests for disambiguation service."""
 
-import json
-from unittest.mock import AsyncMock, MagicMock
+from collections import namedtuple
+from unittest.mock import AsyncMock
 
 import pytest
 
 from media_resolver.disambiguation.service import DisambiguationService
 from media_resolver.models import MediaCandidate, MediaKind
 
+# Lightweight stand-in for a LangChain AIMessage; a full mock object is
+# needlessly heavy for a two-field response.
+LLMResponse = namedtuple("LLMResponse", ["content", "response_metadata"])
+
+# Constant LLM payloads, written out once here instead of serialized per test
+_REORDER_102_RESPONSE = (
+    '{"reasoning": "Candidate 1 is the best match because it\'s an exact match",'
+    ' "ranked_indices": [1, 0, 2], "confidence": "high"}'
+)
+_RANK_01_RESPONSE = '{"reasoning": "Test", "ranked_indices": [0, 1], "confidence": "high"}'
+_RANK_012_RESPONSE = (
+    '{"reasoning": "Multiple good matches", "ranked_indices": [0, 1, 2], "confidence": "medium"}'
+)
+_RANK_120_RESPONSE = (
+    '{"reasoning": "B is best match", "ranked_indices": [1, 2, 0], "confidence": "high"}'
+)
+_OUT_OF_BOUNDS_RESPONSE = (
+    '{"reasoning": "Test", "ranked_indices": [1, 5, 0, -1], "confidence": "low"}'
+)
+
 
 @pytest.mark.asyncio
 class TestDisambiguationService:
@@ -26,6 +46,22 @@ class TestDisambiguationService:
         assert interaction is None  # No LLM call needed
         mock_llm.ainvoke.assert_not_called()
 
+    async def test_disambiguate_top_k_covers_candidates(self):
+        """Test disambiguation skips the LLM when top_k covers all candidates."""
+        mock_llm = AsyncMock()
+        service = DisambiguationService(llm=mock_llm)
+
+        candidates = [
+            MediaCandidate(id="0", kind=MediaKind.TRACK, title="Track A"),
+            MediaCandidate(id="1", kind=MediaKind.TRACK, title="Track B"),
+        ]
+
+        ranked, interaction = await service.disambiguate("test", candidates, top_k=2)
+
+        assert len(ranked) == 2
+        assert interaction is None  # Ranking can't change the returned set
+        mock_llm.ainvoke.assert_not_called()
+
     async def test_disambiguate_empty_candidates(self):
         """Test disambiguation with no candidates."""
         mock_llm = AsyncMock()
@@ -41,15 +77,10 @@ class TestDisambiguationService:
         mock_llm = AsyncMock()
 
         # Mock LLM response
-        llm_response = MagicMock()
-        llm_response.content = json.dumps(
-            {
-                "reasoning": "Candidate 1 is the best match because it's an exact match",
-                "ranked_indices": [1, 0, 2],
-                "confidence": "high",
-            }
+        llm_response = LLMResponse(
+            content=_REORDER_102_RESPONSE,
+            response_metadata={"usage": {"input_tokens": 150, "output_tokens": 50}},
         )
-        llm_response.response_metadata = {"usage": {"input_tokens": 150, "output_tokens": 50}}
 
         mock_llm.ainvoke.return_value = llm_response
         service = DisambiguationService(llm=mock_llm)
@@ -78,15 +109,16 @@ class TestDisambiguationService:
         """Test parsing LLM response with markdown code blocks."""
         mock_llm = AsyncMock()
 
-        llm_response = MagicMock()
-        llm_response.content = """```json
+        llm_response = LLMResponse(
+            content="""```json
 {
   "reasoning": "Test reasoning",
   "ranked_indices": [0, 1],
   "confidence": "high"
 }
-```"""
-        llm_response.response_metadata = {"usage": {}}
+```""",
+            response_metadata={"usage": {}},
+        )
 
         mock_llm.ainvoke.return_value = llm_response
         service = DisambiguationService(llm=mock_llm)
@@ -106,9 +138,7 @@ class TestDisambiguationService:
         """Test fallback to original order on parse error."""
         mock_llm = AsyncMock()
 
-        llm_response = MagicMock()
-        llm_response.content = "This is not valid JSON"
-        llm_response.response_metadata = {}
+        llm_response = LLMResponse(content="This is not valid JSON", response_metadata={})
 
         mock_llm.ainvoke.return_value = llm_response
         service = DisambiguationService(llm=mock_llm)
@@ -116,6 +146,7 @@ class TestDisambiguationService:
         candidates = [
             MediaCandidate(id="0", kind=MediaKind.TRACK, title="Track A"),
             MediaCandidate(id="1", kind=MediaKind.TRACK, title="Track B"),
+            MediaCandidate(id="2", kind=MediaKind.TRACK, title="Track C"),
         ]
 
         ranked, interaction = await service.disambiguate("test", candidates, top_k=2)
@@ -147,11 +178,7 @@ class TestDisambiguationService:
         """Test should_clarify with few candidates."""
         mock_llm = AsyncMock()
 
-        llm_response = MagicMock()
-        llm_response.content = json.dumps(
-            {"reasoning": "Test", "ranked_indices": [0, 1], "confidence": "high"}
-        )
-        llm_response.response_metadata = {}
+        llm_response = LLMResponse(content=_RANK_01_RESPONSE, response_metadata={})
 
         mock_llm.ainvoke.return_value = llm_response
         service = DisambiguationService(llm=mock_llm)
@@ -169,15 +196,7 @@ class TestDisambiguationService:
         """Test should_clarify with many similar candidates."""
         mock_llm = AsyncMock()
 
-        llm_response = MagicMock()
-        llm_response.content = json.dumps(
-            {
-                "reasoning": "Multiple good matches",
-                "ranked_indices": [0, 1, 2],
-                "confidence": "medium",
-            }
-        )
-        llm_response.response_metadata = {}
+        llm_response = LLMResponse(content=_RANK_012_RESPONSE, response_metadata={})
 
         mock_llm.ainvoke.return_value = llm_response
         service = DisambiguationService(llm=mock_llm)
@@ -199,33 +218,24 @@ class TestDisambiguationService:
 class TestDisambiguationPromptBuilding:
     """Tests for prompt building methods."""
 
-    def test_build_system_prompt_basic(self):
+    def test_build_system_prompt_basic(self, disambiguation_service):
         """Test building basic system prompt."""
-        mock_llm = AsyncMock()
-        service = DisambiguationService(llm=mock_llm)
-
-        prompt = service._build_system_prompt()
+        prompt = disambiguation_service._build_system_prompt()
 
         assert "music and podcast recommendation" in prompt.lower()
         assert "rank the candidates" in prompt.lower()
 
-    def test_build_system_prompt_with_context(self):
+    def test_build_system_prompt_with_context(self, disambiguation_service):
         """Test building system prompt with context."""
-        mock_llm = AsyncMock()
-        service = DisambiguationService(llm=mock_llm)
-
         context = {"media_type": "music", "user_preference": "rock"}
 
-        prompt = service._build_system_prompt(context)
+        prompt = disambiguation_service._build_system_prompt(context)
 
         assert "media_type" in prompt
         assert "rock" in prompt
 
-    def test_build_user_prompt(self):
+    def test_build_user_prompt(self, disambiguation_service):
         """Test building user prompt with candidates."""
-        mock_llm = AsyncMock()
-        service = DisambiguationService(llm=mock_llm)
-
         candidates = [
             MediaCandidate(
                 id="0",
@@ -236,41 +246,33 @@ class TestDisambiguationPromptBuilding:
             ),
         ]
 
-        prompt = service._build_user_prompt("test query", candidates, top_k=1)
+        prompt = disambiguation_service._build_user_prompt("test query", candidates, top_k=1)
 
         assert "test query" in prompt
         assert "Test Track" in prompt
         assert "Test Artist" in prompt
         assert "ranked_indices" in prompt
 
-    def test_parse_llm_response_valid_json(self):
+    def test_parse_llm_response_valid_json(self, disambiguation_service):
         """Test parsing valid LLM JSON response."""
-        mock_llm = AsyncMock()
-        service = DisambiguationService(llm=mock_llm)
-
         candidates = [
             MediaCandidate(id="0", kind=MediaKind.TRACK, title="Track A"),
             MediaCandidate(id="1", kind=MediaKind.TRACK, title="Track B"),
             MediaCandidate(id="2", kind=MediaKind.TRACK, title="Track C"),
         ]
 
-        response_json = json.dumps(
-            {"reasoning": "B is best match", "ranked_indices": [1, 2, 0], "confidence": "high"}
+        reasoning, ranked = disambiguation_service._parse_llm_response(
+            _RANK_120_RESPONSE, candidates
         )
 
-        reasoning, ranked = service._parse_llm_response(response_json, candidates)
-
         assert reasoning == "B is best match"
         assert len(ranked) == 3
         assert ranked[0].id == "1"  # Track B
         assert ranked[1].id == "2"  # Track C
         assert ranked[2].id == "0"  # Track A
 
-    def test_parse_llm_response_invalid_json(self):
+    def test_parse_llm_response_invalid_json(self, disambiguation_service):
         """Test parsing invalid JSON falls back to original order."""
-        mock_llm = AsyncMock()
-        service = DisambiguationService(llm=mock_llm)
-
         candidates = [
             MediaCandidate(id="0", kind=MediaKind.TRACK, title="Track A"),
             MediaCandidate(id="1", kind=MediaKind.TRACK, title="Track B"),
@@ -278,32 +280,24 @@ class TestDisambiguationPromptBuilding:
 
         response_text = "This is not JSON"
 
-        reasoning, ranked = service._parse_llm_response(response_text, candidates)
+        reasoning, ranked = disambiguation_service._parse_llm_response(response_text, candidates)
 
         assert "Failed to parse" in reasoning
         assert len(ranked) == 2
         assert ranked[0].id == "0"  # Original order preserved
 
-    def test_parse_llm_response_out_of_bounds_indices(self):
+    def test_parse_llm_response_out_of_bounds_indices(self, disambiguation_service):
         """Test parsing with out-of-bounds indices."""
-        mock_llm = AsyncMock()
-        service = DisambiguationService(llm=mock_llm)
-
         candidates = [
             MediaCandidate(id="0", kind=MediaKind.TRACK, title="Track A"),
             MediaCandidate(id="1", kind=MediaKind.TRACK, title="Track B"),
         ]
 
-        response_json = json.dumps(
-            {
-                "reasoning": "Test",
-                "ranked_indices": [1, 5, 0, -1],  # 5 and -1 are out of bounds
-                "confidence": "low",
-            }
+        # Indices 5 and -1 are out of bounds
+        reasoning, ranked = disambiguation_service._parse_llm_response(
+            _OUT_OF_BOUNDS_RESPONSE, candidates
         )
 
-        reasoning, ranked = service._parse_llm_response(response_json, candidates)
-
         # Should only include valid indices
         assert len(ranked) == 2
         assert ranked[0].id == "1"
@@ -1,6 +1,7 @@
 """Unit tests for Mopidy client."""
 
-from unittest.mock import AsyncMock, MagicMock
+import json
+from unittest.mock import AsyncMock
 
 import pytest
 
@@ -20,7 +21,6 @@ class TestMopidyClientInit:
         client = MopidyClient("http://localhost:6680/mopidy/rpc", timeout=15)
         assert client.rpc_url == "http://localhost:6680/mopidy/rpc"
         assert client.timeout == 15
-        assert client._request_id == 0
         assert client._client is None
 
     def test_next_request_id(self):
@@ -58,40 +58,34 @@ class TestMopidyClientCalls:
         with pytest.raises(MopidyConnectionError, match="Client not initialized"):
             await client.call("core.playback.get_state")
 
-    async def test_successful_call(self):
+    async def test_successful_call(self, make_response, make_http):
         """Test successful RPC call."""
         client = MopidyClient("http://localhost:6680/mopidy/rpc")
 
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"jsonrpc": "2.0", "id": 1, "result": "playing"}
+        mock_response = make_response({"jsonrpc": "2.0", "id": 1, "result": "playing"})
 
-        mock_http_client = AsyncMock()
-        mock_http_client.post.return_value = mock_response
+        fake_http = make_http(mock_response)
 
-        client._client = mock_http_client
+        client._client = fake_http
 
         result = await client.call("core.playback.get_state")
 
         assert result == "playing"
-        mock_http_client.post.assert_called_once()
+        assert len(fake_http.calls) == 1
 
-    async def test_call_with_params(self):
+    async def test_call_with_params(self, make_response, make_http):
         """Test RPC call with parameters."""
         client = MopidyClient("http://localhost:6680/mopidy/rpc")
 
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"jsonrpc": "2.0", "id": 1, "result": []}
+        mock_response = make_response({"jsonrpc": "2.0", "id": 1, "result": []})
 
-        mock_http_client = AsyncMock()
-        mock_http_client.post.return_value = mock_response
+        fake_http = make_http(mock_response)
 
-        client._client = mock_http_client
+        client._client = fake_http
 
         await client.call("core.library.search", query={"artist": ["Beatles"]})
 
-        # Verify params were passed
-        call_args = mock_http_client.post.call_args
-        payload = call_args[1]["json"]
+        payload = json.loads(fake_http.last[1]["content"])
         assert payload["method"] == "core.library.search"
         assert payload["params"]["query"] == {"artist": ["Beatles"]}
 
@@ -109,21 +103,77 @@ class TestMopidyClientCalls:
         with pytest.raises(MopidyConnectionError, match="Failed to connect"):
             await client.call("core.playback.get_state")
 
-    async def test_rpc_error(self):
+    async def test_batch_call(self, make_response, make_http):
+        """Test batched RPC calls share one HTTP request."""
+        client = MopidyClient("http://localhost:6680/mopidy/rpc")
+
+        mock_response = make_response(
+            [
+                {"jsonrpc": "2.0", "id": 2, "result": "added"},
+                {"jsonrpc": "2.0", "id": 1, "result": None},
+            ]
+        )
+
+        fake_http = make_http(mock_response)
+
+        client._client = fake_http
+
+        results = await client.batch(
+            [
+                ("core.tracklist.clear", {}),
+                ("core.tracklist.add", {"uris": ["test:track:1"]}),
+            ]
+        )
+
+        # Results realigned to call order despite out-of-order response
+        assert results == [None, "added"]
+        assert len(fake_http.calls) == 1
+
+        payload = json.loads(fake_http.last[1]["content"])
+        assert [item["method"] for item in payload] == [
+            "core.tracklist.clear",
+            "core.tracklist.add",
+        ]
+
+    async def test_batch_call_error(self, make_response, make_http):
+        """Test batch raises when any call in the batch fails."""
+        client = MopidyClient("http://localhost:6680/mopidy/rpc")
+
+        mock_response = make_response(
+            [
+                {"jsonrpc": "2.0", "id": 1, "result": None},
+                {
+                    "jsonrpc": "2.0",
+                    "id": 2,
+                    "error": {"code": -32601, "message": "Method not found", "data": None},
+                },
+            ]
+        )
+
+        fake_http = make_http(mock_response)
+
+        client._client = fake_http
+
+        with pytest.raises(MopidyRPCError) as exc_info:
+            await client.batch([("core.tracklist.clear", {}), ("core.invalid.method", {})])
+
+        assert exc_info.value.code == -32601
+
+    async def test_rpc_error(self, make_response, make_http):
         """Test handling RPC errors."""
         client = MopidyClient("http://localhost:6680/mopidy/rpc")
 
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "error": {"code": -32601, "message": "Method not found", "data": None},
-        }
+        mock_response = make_response(
+            {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "error": {"code": -32601, "message": "Method not found", "data": None},
+            }
+        )
 
-        mock_http_client = AsyncMock()
-        mock_http_client.post.return_value = mock_response
+        fake_http = make_http(mock_response)
 
-        client._client = mock_http_client
+        client._client = fake_http
 
         with pytest.raises(MopidyRPCError) as exc_info:
             await client.call("core.invalid.method")
@@ -136,77 +186,96 @@ class TestMopidyClientCalls:
 class TestMopidyClientHighLevel:
     """Tests for high-level client methods."""
 
-    async def test_search(self):
+    async def test_search(self, make_response, make_http):
         """Test library search."""
         client = MopidyClient("http://localhost:6680/mopidy/rpc")
 
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"jsonrpc": "2.0", "id": 1, "result": []}
+        mock_response = make_response({"jsonrpc": "2.0", "id": 1, "result": []})
 
-        mock_http_client = AsyncMock()
-        mock_http_client.post.return_value = mock_response
+        fake_http = make_http(mock_response)
 
-        client._client = mock_http_client
+        client._client = fake_http
 
         results = await client.search(query={"artist": ["Beatles"]})
 
         assert isinstance(results, list)
 
-    async def test_get_playlists(self):
+    async def test_multi_search(self, make_response, make_http):
+        """Test multiple searches share one batched request."""
+        client = MopidyClient("http://localhost:6680/mopidy/rpc")
+
+        mock_response = make_response(
+            [
+                {"jsonrpc": "2.0", "id": 1, "result": [{"tracks": []}]},
+                {"jsonrpc": "2.0", "id": 2, "result": [{"artists": []}]},
+            ]
+        )
+
+        fake_http = make_http(mock_response)
+
+        client._client = fake_http
+
+        results = await client.multi_search([{"artist": ["Beatles"]}, {"album": ["Abbey Road"]}])
+
+        assert results == [[{"tracks": []}], [{"artists": []}]]
+        assert len(fake_http.calls) == 1
+
+        payload = json.loads(fake_http.last[1]["content"])
+        assert [item["method"] for item in payload] == [
+            "core.library.search",
+            "core.library.search",
+        ]
+        assert payload[0]["params"]["query"] == {"artist": ["Beatles"]}
+
+    async def test_get_playlists(self, make_response, make_http):
         """Test getting playlists."""
         client = MopidyClient("http://localhost:6680/mopidy/rpc")
 
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "result": [{"uri": "playlist:1", "name": "Rock Classics"}],
-        }
+        mock_response = make_response(
+            {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "result": [{"uri": "playlist:1", "name": "Rock Classics"}],
+            }
+        )
 
-        mock_http_client = AsyncMock()
-        mock_http_client.post.return_value = mock_response
+        fake_http = make_http(mock_response)
 
-        client._client = mock_http_client
+        client._client = fake_http
 
         playlists = await client.get_playlists()
 
         assert len(playlists) == 1
         assert playlists[0]["name"] == "Rock Classics"
 
-    async def test_clear_tracklist(self):
+    async def test_clear_tracklist(self, make_response, make_http):
         """Test clearing tracklist."""
         client = MopidyClient("http://localhost:6680/mopidy/rpc")
 
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"jsonrpc": "2.0", "id": 1, "result": None}
+        mock_response = make_response({"jsonrpc": "2.0", "id": 1, "result": None})
 
-        mock_http_client = AsyncMock()
-        mock_http_client.post.return_value = mock_response
+        fake_http = make_http(mock_response)
 
-        client._client = mock_http_client
+        client._client = fake_http
 
         await client.clear_tracklist()
 
-        call_args = mock_http_client.post.call_args
-        payload = call_args[1]["json"]
+        payload = json.loads(fake_http.last[1]["content"])
         assert payload["method"] == "core.tracklist.clear"
 
-    async def test_play(self):
+    async def test_play(self, make_response, make_http):
         """Test starting playback."""
         client = MopidyClient("http://localhost:6680/mopidy/rpc")
 
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"jsonrpc": "2.0", "id": 1, "result": None}
+        mock_response = make_response({"jsonrpc": "2.0", "id": 1, "result": None})
 
-        mock_http_client = AsyncMock()
-        mock_http_client.post.return_value = mock_response
+        fake_http = make_http(mock_response)
 
-        client._client = mock_http_client
+        client._client = fake_http
 
         await client.play()
 
-        call_args = mock_http_client.post.call_args
-        payload = call_args[1]["json"]
+        payload = json.loads(fake_http.last[1]["content"])
         assert payload["method"] == "core.playback.play"
 
 
@@ -271,10 +340,8 @@ class TestMopidyClientNowPlaying:
         """Test getting current playback info."""
         client = MopidyClient("http://localhost:6680/mopidy/rpc")
 
-        # Mock responses for get_current_track, get_state, get_time_position
-        client.get_current_track = AsyncMock(return_value=sample_mopidy_track)
-        client.get_state = AsyncMock(return_value="playing")
-        client.get_time_position = AsyncMock(return_value=45000)  # 45 seconds in ms
+        # Track, state, and position arrive in one batched response
+        client.batch = AsyncMock(return_value=[sample_mopidy_track, "playing", 45000])
 
         now_playing = await client.get_now_playing()
 
@@ -288,8 +355,7 @@ class TestMopidyClientNowPlaying:
         """Test now playing when stopped."""
         client = MopidyClient("http://localhost:6680/mopidy/rpc")
 
-        client.get_current_track = AsyncMock(return_value={"uri": "test", "name": "Test"})
-        client.get_state = AsyncMock(return_value="stopped")
+        client.batch = AsyncMock(return_value=[{"uri": "test", "name": "Test"}, "stopped", 0])
 
         now_playing = await client.get_now_playing()
 
@@ -299,7 +365,7 @@ class TestMopidyClientNowPlaying:
         """Test now playing when no track is playing."""
         client = MopidyClient("http://localhost:6680/mopidy/rpc")
 
-        client.get_current_track = AsyncMock(return_value=None)
+        client.batch = AsyncMock(return_value=[None, "stopped", 0])
 
         now_playing = await client.get_now_playing()
 
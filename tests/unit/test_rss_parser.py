@@ -1,51 +1,58 @@
 """Unit tests for RSS feed parser."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
-
+import httpx
 import pytest
 
 from media_resolver.models import MediaKind
 from media_resolver.podcast.rss_parser import PodcastRSSParser, RSSParserError
 
 
+def make_parser(feed_text: str) -> PodcastRSSParser:
+    """Create a parser whose transport serves the given feed body."""
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, text=feed_text))
+    return PodcastRSSParser(client=httpx.AsyncClient(transport=transport))
+
+
 @pytest.mark.asyncio
 class TestPodcastRSSParser:
     """Tests for PodcastRSSParser."""
 
-    async def test_fetch_feed_success(self, sample_rss_feed):
+    async def test_fetch_feed_success(self, rss_parser):
         """Test successfully fetching and parsing RSS feed."""
-        parser = PodcastRSSParser()
-
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_response = MagicMock()
-            mock_response.text = sample_rss_feed
-            mock_response.raise_for_status = MagicMock()
-
-            mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.get.return_value = mock_response
-            mock_client_class.return_value = mock_client
-
-            feed = await parser.fetch_feed("https://example.com/feed.xml")
-
-            assert feed is not None
-            assert len(feed.entries) == 2
-            assert feed.entries[0]["title"] == "Episode 1: Introduction"
+        feed = await rss_parser.fetch_feed("https://example.com/feed.xml")
+
+        assert feed is not None
+        assert len(feed.entries) == 2
+        assert feed.entries[0]["title"] == "Episode 1: Introduction"
+
+    async def test_fetch_feed_atom_fallback(self):
+        """Test that Atom feeds fall back to feedparser and still parse."""
+        atom_feed = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+    <title>Atom Podcast</title>
+    <entry>
+        <title>Atom Episode</title>
+        <id>atom-1</id>
+        <link rel="enclosure" type="audio/mpeg" href="https://example.com/atom1.mp3"/>
+    </entry>
+</feed>"""
+        parser = make_parser(atom_feed)
+
+        feed = await parser.fetch_feed("https://example.com/atom.xml")
+
+        assert len(feed.entries) == 1
+        assert feed.entries[0]["title"] == "Atom Episode"
 
     async def test_fetch_feed_http_error(self):
         """Test handling HTTP errors when fetching feed."""
-        parser = PodcastRSSParser()
 
-        with patch("httpx.AsyncClient") as mock_client_class:
-            import httpx
+        def handler(request):
+            raise httpx.ConnectError("Not found")
 
-            mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.get.side_effect = httpx.HTTPError("Not found")
-            mock_client_class.return_value = mock_client
+        parser = PodcastRSSParser(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
 
-            with pytest.raises(RSSParserError, match="Failed to fetch RSS feed"):
-                await parser.fetch_feed("https://example.com/notfound.xml")
+        with pytest.raises(RSSParserError, match="Failed to fetch RSS feed"):
+            await parser.fetch_feed("https://example.com/notfound.xml")
 
     def test_entry_to_candidate(self, sample_podcast_entry):
         """Test converting RSS entry to MediaCandidate."""
@@ -93,159 +100,76 @@ class TestPodcastRSSParser:
         assert "<strong>" not in candidate.snippet
         assert "This is a test episode" in candidate.snippet
 
-    async def test_get_latest_episode(self, sample_rss_feed):
+    async def test_get_latest_episode(self, rss_parser):
         """Test getting latest episode from feed."""
-        parser = PodcastRSSParser()
-
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_response = MagicMock()
-            mock_response.text = sample_rss_feed
-            mock_response.raise_for_status = MagicMock()
-
-            mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.get.return_value = mock_response
-            mock_client_class.return_value = mock_client
+        latest = await rss_parser.get_latest_episode(
+            "https://example.com/feed.xml", show_name="Test Podcast"
+        )
 
-            latest = await parser.get_latest_episode(
-                "https://example.com/feed.xml", show_name="Test Podcast"
-            )
-
-            assert latest is not None
-            assert latest.title == "Episode 1: Introduction"
-            assert latest.subtitle == "Test Podcast"
+        assert latest is not None
+        assert latest.title == "Episode 1: Introduction"
+        assert latest.subtitle == "Test Podcast"
 
     async def test_get_latest_episode_empty_feed(self):
         """Test getting latest episode from empty feed."""
-        parser = PodcastRSSParser()
-
         empty_feed = """<?xml version="1.0" encoding="UTF-8"?>
 <rss version="2.0">
     <channel>
         <title>Empty Podcast</title>
     </channel>
 </rss>"""
+        parser = make_parser(empty_feed)
 
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_response = MagicMock()
-            mock_response.text = empty_feed
-            mock_response.raise_for_status = MagicMock()
-
-            mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.get.return_value = mock_response
-            mock_client_class.return_value = mock_client
+        latest = await parser.get_latest_episode("https://example.com/feed.xml")
 
-            latest = await parser.get_latest_episode("https://example.com/feed.xml")
+        assert latest is None
 
-            assert latest is None
-
-    async def test_get_random_episode(self, sample_rss_feed):
+    async def test_get_random_episode(self, rss_parser):
         """Test getting random episode from feed."""
-        parser = PodcastRSSParser()
+        random_ep = await rss_parser.get_random_episode("https://example.com/feed.xml")
 
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_response = MagicMock()
-            mock_response.text = sample_rss_feed
-            mock_response.raise_for_status = MagicMock()
+        assert random_ep is not None
+        assert random_ep.kind == MediaKind.PODCAST_EPISODE
+        # Should be one of the two episodes
+        assert random_ep.title in ["Episode 1: Introduction", "Episode 2: Advanced Topics"]
 
-            mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.get.return_value = mock_response
-            mock_client_class.return_value = mock_client
-
-            random_ep = await parser.get_random_episode("https://example.com/feed.xml")
-
-            assert random_ep is not None
-            assert random_ep.kind == MediaKind.PODCAST_EPISODE
-            # Should be one of the two episodes
-            assert random_ep.title in ["Episode 1: Introduction", "Episode 2: Advanced Topics"]
-
-    async def test_search_episodes(self, sample_rss_feed):
+    async def test_search_episodes(self, rss_parser):
         """Test searching episodes by query."""
-        parser = PodcastRSSParser()
-
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_response = MagicMock()
-            mock_response.text = sample_rss_feed
-            mock_response.raise_for_status = MagicMock()
-
-            mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.get.return_value = mock_response
-            mock_client_class.return_value = mock_client
-
-            # Search for "Advanced"
-            results = await parser.search_episodes(
-                "https://example.com/feed.xml", query="Advanced", limit=5
-            )
-
-            assert len(results) > 0
-            # Should find Episode 2
-            assert any("Advanced" in r.title for r in results)
-            # Results should be sorted by score
-            if len(results) > 1:
-                assert results[0].score >= results[1].score
-
-    async def test_search_episodes_exact_match(self, sample_rss_feed):
+        # Search for "Advanced"
+        results = await rss_parser.search_episodes(
+            "https://example.com/feed.xml", query="Advanced", limit=5
+        )
+
+        assert len(results) > 0
+        # Should find Episode 2
+        assert any("Advanced" in r.title for r in results)
+        # Results should be sorted by score
+        if len(results) > 1:
+            assert results[0].score >= results[1].score
+
+    async def test_search_episodes_exact_match(self, rss_parser):
         """Test search with exact title match gets highest score."""
-        parser = PodcastRSSParser()
-
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_response = MagicMock()
-            mock_response.text = sample_rss_feed
-            mock_response.raise_for_status = MagicMock()
-
-            mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.get.return_value = mock_response
-            mock_client_class.return_value = mock_client
-
-            results = await parser.search_episodes(
-                "https://example.com/feed.xml", query="Episode 1: Introduction", limit=5
-            )
+        results = await rss_parser.search_episodes(
+            "https://example.com/feed.xml", query="Episode 1: Introduction", limit=5
+        )
 
-            assert len(results) > 0
-            # Exact match should have score 1.0
-            assert results[0].score == 1.0
+        assert len(results) > 0
+        # Exact match should have score 1.0
+        assert results[0].score == 1.0
 
-    async def test_search_episodes_no_matches(self, sample_rss_feed):
+    async def test_search_episodes_no_matches(self, rss_parser):
         """Test search with no matches."""
-        parser = PodcastRSSParser()
-
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_response = MagicMock()
-            mock_response.text = sample_rss_feed
-            mock_response.raise_for_status = MagicMock()
-
-            mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.get.return_value = mock_response
-            mock_client_class.return_value = mock_client
-
-            results = await parser.search_episodes(
-                "https://example.com/feed.xml", query="nonexistent", limit=5
-            )
+        results = await rss_parser.search_episodes(
+            "https://example.com/feed.xml", query="nonexistent", limit=5
+        )
 
-            assert len(results) == 0
+        assert len(results) == 0
 
-    async def test_get_show_info(self, sample_rss_feed):
+    async def test_get_show_info(self, rss_parser):
         """Test getting podcast show information."""
-        parser = PodcastRSSParser()
-
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_response = MagicMock()
-            mock_response.text = sample_rss_feed
-            mock_response.raise_for_status = MagicMock()
-
-            mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.get.return_value = mock_response
-            mock_client_class.return_value = mock_client
-
-            show = await parser.get_show_info("https://example.com/feed.xml")
+        show = await rss_parser.get_show_info("https://example.com/feed.xml")
 
-            assert show is not None
-            assert show.kind == MediaKind.PODCAST_SHOW
-            assert show.title == "Test Podcast"
-            assert show.id == "https://example.com/feed.xml"
+        assert show is not None
+        assert show.kind == MediaKind.PODCAST_SHOW
+        assert show.title == "Test Podcast"
+        assert show.id == "https://example.com/feed.xml"
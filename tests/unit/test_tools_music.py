@@ -0,0 +1,141 @@
+"""Unit tests for music tool helpers."""
+
+from media_resolver.models import MediaCandidate, MediaKind
+from media_resolver.tools.music import (
+    _dedupe_candidates,
+    _find_exact_match,
+    _normalize_title,
+    _prefilter,
+)
+
+
+def make_artist(id: str, title: str, subtitle: str | None = None) -> MediaCandidate:
+    """Create an artist candidate for testing."""
+    return MediaCandidate(id=id, kind=MediaKind.ARTIST, title=title, subtitle=subtitle, score=1.0)
+
+
+class TestDedupeCandidates:
+    """Tests for candidate deduplication."""
+
+    def test_removes_duplicates_across_backends(self):
+        """Test that same title/subtitle from different backends is collapsed."""
+        candidates = [
+            make_artist("spotify:artist:1", "The Beatles"),
+            make_artist("local:artist:1", "The Beatles"),
+            make_artist("spotify:artist:2", "The Kinks"),
+        ]
+
+        deduped = _dedupe_candidates(candidates)
+
+        assert len(deduped) == 2
+        assert deduped[0].id == "spotify:artist:1"  # First occurrence wins
+        assert deduped[1].title == "The Kinks"
+
+    def test_case_insensitive(self):
+        """Test dedup is case-insensitive."""
+        candidates = [
+            make_artist("a", "The Beatles"),
+            make_artist("b", "the beatles"),
+        ]
+
+        assert len(_dedupe_candidates(candidates)) == 1
+
+    def test_different_subtitles_kept(self):
+        """Test that same title with different subtitles is kept."""
+        candidates = [
+            make_artist("a", "Greatest Hits", subtitle="Queen"),
+            make_artist("b", "Greatest Hits", subtitle="ABBA"),
+        ]
+
+        assert len(_dedupe_candidates(candidates)) == 2
+
+
+class TestNormalizeTitle:
+    """Tests for title normalization."""
+
+    def test_casefold(self):
+        """Test case folding."""
+        assert _normalize_title("The BEATLES") == "the beatles"
+
+    def test_strips_diacritics(self):
+        """Test diacritics are stripped."""
+        assert _normalize_title("Beyoncé") == "beyonce"
+        assert _normalize_title("Sigur Rós") == "sigur ros"
+
+
+class TestFindExactMatch:
+    """Tests for the exact-match disambiguation short-circuit."""
+
+    def test_exact_match(self):
+        """Test single exact title match is returned."""
+        candidates = [
+            make_artist("a", "The Beatles"),
+            make_artist("b", "The Beatles Tribute Band"),
+        ]
+
+        match = _find_exact_match("The Beatles", candidates)
+
+        assert match is not None
+        assert match.id == "a"
+
+    def test_case_difference_still_matches(self):
+        """Test case-insensitive exact matching."""
+        candidates = [
+            make_artist("a", "the beatles"),
+            make_artist("b", "Beatlemania"),
+        ]
+
+        match = _find_exact_match("The Beatles", candidates)
+
+        assert match is not None
+        assert match.id == "a"
+
+    def test_diacritics_match(self):
+        """Test diacritics don't prevent an exact match."""
+        candidates = [
+            make_artist("a", "Beyoncé"),
+            make_artist("b", "Beyond the Black"),
+        ]
+
+        match = _find_exact_match("beyonce", candidates)
+
+        assert match is not None
+        assert match.id == "a"
+
+    def test_no_match_returns_none(self):
+        """Test no exact match returns None."""
+        candidates = [
+            make_artist("a", "The Beatles Tribute Band"),
+            make_artist("b", "Beatlemania"),
+        ]
+
+        assert _find_exact_match("The Beatles", candidates) is None
+
+    def test_multiple_matches_returns_none(self):
+        """Test ambiguous exact matches still need disambiguation."""
+        candidates = [
+            make_artist("a", "Nirvana"),
+            make_artist("b", "Nirvana"),  # UK band vs. US band
+        ]
+
+        assert _find_exact_match("Nirvana", candidates) is None
+
+
+class TestPrefilter:
+    """Tests for the lexical prefilter."""
+
+    def test_small_list_unchanged(self):
+        """Test lists at or below k are returned as-is."""
+        candidates = [make_artist(str(i), f"Artist {i}") for i in range(5)]
+
+        assert _prefilter("artist", candidates, k=30) is candidates
+
+    def test_keeps_top_k_by_score(self):
+        """Test larger lists are narrowed to the best lexical matches."""
+        candidates = [make_artist(str(i), f"Unrelated Band {i}") for i in range(40)]
+        candidates.append(make_artist("target", "Radiohead"))
+
+        filtered = _prefilter("Radiohead", candidates, k=10)
+
+        assert len(filtered) == 10
+        assert filtered[0].id == "target"
@@ -45,7 +45,7 @@ class TestGetStreamUrl:
 class TestNowPlaying:
     """Tests for now_playing tool."""
 
-    async def test_now_playing_success(self, sample_config):
+    async def test_now_playing_success(self):
         """Test getting now playing info successfully."""
         mock_now_playing = NowPlaying(
             title="Test Track",
@@ -56,59 +56,51 @@ class TestNowPlaying:
             mopidy_uri="spotify:track:123",
         )
 
-        with patch("media_resolver.tools.playback.get_config", return_value=sample_config):
-            with patch("media_resolver.tools.playback.MopidyClient") as mock_client_class:
-                with patch("media_resolver.tools.playback.get_request_logger") as mock_logger:
-                    mock_logger.return_value = MagicMock()
+        with patch("media_resolver.tools.playback.get_mopidy") as mock_get_mopidy:
+            with patch("media_resolver.tools.common.get_request_logger") as mock_logger:
+                mock_logger.return_value = MagicMock()
 
-                    mock_client = AsyncMock()
-                    mock_client.get_now_playing.return_value = mock_now_playing
-                    mock_client.__aenter__.return_value = mock_client
-                    mock_client_class.return_value = mock_client
+                mock_client = AsyncMock()
+                mock_client.get_now_playing.return_value = mock_now_playing
+                mock_get_mopidy.return_value = mock_client
 
-                    result = await now_playing()
+                result = await now_playing()
 
-                    assert "title" in result
-                    assert result["title"] == "Test Track"
-                    assert result["artist_or_show"] == "Test Artist"
+                assert "title" in result
+                assert result["title"] == "Test Track"
+                assert result["artist_or_show"] == "Test Artist"
 
-    async def test_now_playing_nothing_playing(self, sample_config):
+    async def test_now_playing_nothing_playing(self):
         """Test now playing when nothing is playing."""
-        with patch("media_resolver.tools.playback.get_config", return_value=sample_config):
-            with patch("media_resolver.tools.playback.MopidyClient") as mock_client_class:
-                with patch("media_resolver.tools.playback.get_request_logger") as mock_logger:
-                    mock_logger.return_value = MagicMock()
+        with patch("media_resolver.tools.playback.get_mopidy") as mock_get_mopidy:
+            with patch("media_resolver.tools.common.get_request_logger") as mock_logger:
+                mock_logger.return_value = MagicMock()
 
-                    mock_client = AsyncMock()
-                    mock_client.get_now_playing.return_value = None
-                    mock_client.__aenter__.return_value = mock_client
-                    mock_client_class.return_value = mock_client
+                mock_client = AsyncMock()
+                mock_client.get_now_playing.return_value = None
+                mock_get_mopidy.return_value = mock_client
 
-                    result = await now_playing()
+                result = await now_playing()
 
-                    assert "message" in result
-                    assert (
-                        "nothing" in result["message"].lower()
-                        or "not playing" in result["message"].lower()
-                    )
+                assert "message" in result
+                assert (
+                    "nothing" in result["message"].lower()
+                    or "not playing" in result["message"].lower()
+                )
 
-    async def test_now_playing_mopidy_error(self, sample_config):
+    async def test_now_playing_mopidy_error(self):
         """Test error handling in now_playing."""
-        with patch("media_resolver.tools.playback.get_config", return_value=sample_config):
-            with patch("media_resolver.tools.playback.MopidyClient") as mock_client_class:
-                with patch("media_resolver.tools.playback.get_request_logger") as mock_logger:
-                    mock_logger.return_value = MagicMock()
+        with patch("media_resolver.tools.playback.get_mopidy") as mock_get_mopidy:
+            with patch("media_resolver.tools.common.get_request_logger") as mock_logger:
+                mock_logger.return_value = MagicMock()
 
-                    mock_client = AsyncMock()
-                    from media_resolver.mopidy.client import MopidyConnectionError
+                mock_client = AsyncMock()
+                from media_resolver.mopidy.client import MopidyConnectionError
 
-                    mock_client.get_now_playing.side_effect = MopidyConnectionError(
-                        "Connection failed"
-                    )
-                    mock_client.__aenter__.return_value = mock_client
-                    mock_client_class.return_value = mock_client
+                mock_client.get_now_playing.side_effect = MopidyConnectionError("Connection failed")
+                mock_get_mopidy.return_value = mock_client
 
-                    result = await now_playing()
+                result = await now_playing()
 
-                    assert "error_code" in result
-                    assert "mopidy" in result["error_code"].lower()
+                assert "error_code" in result
+                assert "mopidy" in result["error_code"].lower()